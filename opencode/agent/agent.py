@@ -1,6 +1,6 @@
 """Agent management for OpenCode."""
 
-from enum import Enum
+from enum import Enum, StrEnum
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -14,7 +14,7 @@ class AgentMode(str, Enum):
     ALL = "all"
 
 
-class PermissionAction(str, Enum):
+class PermissionAction(StrEnum):
     """Permission action types."""
 
     ALLOW = "allow"
@@ -1,13 +1,14 @@
 """OpenCode CLI main entry point."""
 
 import asyncio
+import functools
 import sys
 from pathlib import Path
 from typing import List, Optional
 
 import typer
 
-from opencode.agent import get_manager as get_agent_manager
+from opencode.agent import AgentInfo, get_manager as get_agent_manager
 from opencode.provider import get_manager as get_provider_manager
 from opencode.server import Server
 from opencode.session import get_manager as get_session_manager
@@ -16,6 +17,36 @@ from opencode.tool import ToolContext
 from opencode.util import Default as DefaultLogger
 from opencode.util import LogLevel, LogOptions, init as init_log
 
+# Set once the global tool registry has been populated for this process
+_TOOLS_READY = False
+
+# Name of the agent `run` uses unless --agent is given
+_DEFAULT_AGENT_NAME = "general"
+
+# Default agent, resolved from the agent manager on first use
+_default_agent: AgentInfo | None = None
+
+# Buffered characters of streamed model output before `run` writes them out
+_STREAM_FLUSH_SIZE = 256
+
+# ASCII logo shown by `web`, including the surrounding blank lines
+_BANNER = (
+    "\n"
+    "   ____                      __         \n"
+    "  / __ \\____ ___  ________  / /__  _____\n"
+    " / / / / __ `/ / / / ___/ / / / _ \\/ ___/\n"
+    "/ /_/ / /_/ / /_/ (__  ) /_/ /  __/ /    \n"
+    "\\____/\\__, /\\__, /____/\\____/\\___/_/     \n"
+    "      /____//____/                       \n"
+    "\n"
+)
+
+# Loopback and Docker bridge (typically 172.x.x.x) addresses hidden by `web`
+_SKIP_IP_PREFIXES = ("127.", "172.")
+
+# Icons for `list` output, keyed by entry type; anything else is a file
+_ENTRY_ICONS = {"directory": "📁"}
+
 app = typer.Typer(
     name="opencode",
     help="AI-powered development tool",
@@ -23,6 +54,55 @@ app = typer.Typer(
 )
 
 
+def _ensure_tools() -> None:
+    """Register all tools once per process."""
+    global _TOOLS_READY
+    if not _TOOLS_READY:
+        register_all_tools()
+        _TOOLS_READY = True
+
+
+@functools.lru_cache(maxsize=8)
+def _tool_ctx(project_dir: str = ".") -> ToolContext:
+    """Get the shared CLI tool context for a project directory."""
+    return ToolContext(session_id="cli", project_dir=project_dir)
+
+
+def _get_agent(name: str) -> AgentInfo | None:
+    """Get an agent by name, caching the default agent after the first lookup."""
+    global _default_agent
+    if name != _DEFAULT_AGENT_NAME:
+        return get_agent_manager().get(name)
+    if _default_agent is None:
+        _default_agent = get_agent_manager().get(name)
+    return _default_agent
+
+
+def _open_browser(url: str) -> None:
+    """Open a URL in the browser without waiting for the opener to exit."""
+    import os
+    import shutil
+    import subprocess
+
+    if sys.platform == "win32":
+        os.startfile(url)
+        return
+
+    opener = "open" if sys.platform == "darwin" else shutil.which("xdg-open")
+    if not opener:
+        import webbrowser
+
+        webbrowser.open(url)
+        return
+
+    subprocess.Popen(
+        [opener, url],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
 @app.callback()
 def main(
     ctx: typer.Context,
@@ -74,7 +154,6 @@ def web(
     """Start OpenCode server and open web interface."""
     import os
     import socket
-    import webbrowser
     from pathlib import Path
     
     # Check for password warning
@@ -86,14 +165,7 @@ def web(
     server = Server(host=host, port=port)
     
     # Display banner
-    typer.echo("")
-    typer.echo("   ____                      __         ")
-    typer.echo("  / __ \\____ ___  ________  / /__  _____")
-    typer.echo(" / / / / __ `/ / / / ___/ / / / _ \\/ ___/")
-    typer.echo("/ /_/ / /_/ / /_/ (__  ) /_/ /  __/ /    ")
-    typer.echo("\\____/\\__, /\\__, /____/\\____/\\___/_/     ")
-    typer.echo("      /____//____/                       ")
-    typer.echo("")
+    sys.stdout.write(_BANNER)
     
     if host == "0.0.0.0":
         # Show localhost for local access
@@ -104,14 +176,12 @@ def web(
         try:
             # Get network interfaces
             import psutil
-            network_ips = []
-            for iface_name, iface_addrs in psutil.net_if_addrs().items():
-                for addr in iface_addrs:
-                    # Skip internal and non-IPv4 addresses
-                    if addr.family == socket.AF_INET and not addr.address.startswith("127."):
-                        # Skip Docker bridge networks (typically 172.x.x.x)
-                        if not addr.address.startswith("172."):
-                            network_ips.append(addr.address)
+            network_ips = [
+                addr.address
+                for iface_addrs in psutil.net_if_addrs().values()
+                for addr in iface_addrs
+                if addr.family == socket.AF_INET and not addr.address.startswith(_SKIP_IP_PREFIXES)
+            ]
             
             for ip in network_ips:
                 typer.echo(f"  Network access:     http://{ip}:{port}")
@@ -121,7 +191,7 @@ def web(
         # Open localhost in browser
         if not no_open:
             try:
-                webbrowser.open(localhost_url)
+                _open_browser(localhost_url)
             except Exception:
                 pass
     else:
@@ -129,7 +199,7 @@ def web(
         typer.echo(f"  Web interface:      {display_url}")
         if not no_open:
             try:
-                webbrowser.open(display_url)
+                _open_browser(display_url)
             except Exception:
                 pass
     
@@ -153,7 +223,7 @@ def version() -> None:
 @app.command()
 def run(
     prompt: str = typer.Argument(..., help="Prompt to send to the AI"),
-    agent: str = typer.Option("general", "--agent", "-a", help="Agent to use"),
+    agent: str = typer.Option(_DEFAULT_AGENT_NAME, "--agent", "-a", help="Agent to use"),
     model: Optional[str] = typer.Option(None, "--model", "-m", help="Model to use (e.g., opencode/big-pickle)"),
     continue_last: bool = typer.Option(False, "--continue", "-c", help="Continue the last session"),
     session_id: Optional[str] = typer.Option(None, "--session", "-s", help="Session ID to continue"),
@@ -162,13 +232,11 @@ def run(
     """Run AI with a prompt using the big-pickle model (no API key required)."""
     
     async def run_session():
-        from opencode.agent import get_manager as get_agent_manager
         from opencode.provider import get_manager as get_provider_manager, CompletionRequest, Message
         from opencode.session import get_manager as get_session_manager, MessageRole, MessagePart
         
         # Get agent
-        agent_manager = get_agent_manager()
-        agent_obj = agent_manager.get(agent)
+        agent_obj = _get_agent(agent)
         if not agent_obj:
             typer.echo(f"Error: Agent '{agent}' not found", err=True)
             sys.exit(1)
@@ -227,14 +295,14 @@ def run(
         if files:
             for file_path in files:
                 path = Path(file_path)
-                if path.exists():
-                    try:
-                        content = path.read_text(encoding="utf-8")
-                        attached_files.append({"path": str(path), "content": content})
-                    except Exception as e:
-                        typer.echo(f"Warning: Could not read file '{file_path}': {e}", err=True)
-                else:
+                try:
+                    content = path.read_text(encoding="utf-8")
+                except FileNotFoundError:
                     typer.echo(f"Warning: File not found: '{file_path}'", err=True)
+                except (OSError, UnicodeDecodeError) as e:
+                    typer.echo(f"Warning: Could not read file '{file_path}': {e}", err=True)
+                else:
+                    attached_files.append({"path": str(path), "content": content})
         
         # Build message content
         message_content = prompt
@@ -276,15 +344,26 @@ def run(
             stream=True
         )
         
-        # Stream the response
+        # Stream the response, coalescing small chunks into fewer writes
         full_response = ""
         chunk_count = 0
+        out = sys.stdout
+        buf: list[str] = []
+        buf_size = 0
+
+        def flush_buf() -> None:
+            nonlocal buf_size
+            if buf:
+                out.write("".join(buf))
+                out.flush()
+                buf.clear()
+                buf_size = 0
+
         try:
             async for chunk in provider_obj.complete(request):
                 chunk_count += 1
                 if chunk.content:
                     # Clean content for Windows console compatibility
-                    import sys
                     content = chunk.content
                     if sys.platform == "win32":
                         # Remove emojis and problematic characters for Windows console
@@ -292,10 +371,14 @@ def run(
                         # Remove emoji characters
                         content = re.sub(r'[^\x00-\x7F]+', '', content)
                     
-                    typer.echo(content, nl=False)
+                    buf.append(content)
+                    buf_size += len(content)
+                    if buf_size >= _STREAM_FLUSH_SIZE:
+                        flush_buf()
                     full_response += content
                 if chunk.finish_reason:
                     break
+            flush_buf()
             
             if chunk_count == 0:
                 typer.echo("(No response received from model)", err=True)
@@ -304,6 +387,7 @@ def run(
             else:
                 typer.echo("")  # New line at end
         except Exception as e:
+            flush_buf()
             typer.echo(f"\nError calling model: {e}", err=True)
             sys.exit(1)
         
@@ -580,8 +664,8 @@ def shell(
 ) -> None:
     """Execute a shell command using OpenCode tools."""
     async def run_shell():
-        register_all_tools()
-        context = ToolContext(session_id="cli", project_dir=cwd or ".")
+        _ensure_tools()
+        context = _tool_ctx(cwd or ".")
         registry = get_registry()
         result = await registry.execute("bash", {"command": command}, context)
         typer.echo(result.get("stdout", ""))
@@ -601,8 +685,8 @@ def read(
 ) -> None:
     """Read a file using OpenCode tools."""
     async def run_read():
-        register_all_tools()
-        context = ToolContext(session_id="cli", project_dir=".")
+        _ensure_tools()
+        context = _tool_ctx()
         registry = get_registry()
         result = await registry.execute("read", {"path": path, "offset": offset, "limit": limit}, context)
         if "error" in result:
@@ -620,8 +704,8 @@ def write(
 ) -> None:
     """Write content to a file using OpenCode tools."""
     async def run_write():
-        register_all_tools()
-        context = ToolContext(session_id="cli", project_dir=".")
+        _ensure_tools()
+        context = _tool_ctx()
         registry = get_registry()
         result = await registry.execute("write", {"path": path, "content": content}, context)
         if result.get("success"):
@@ -641,8 +725,8 @@ def edit(
 ) -> None:
     """Edit a file by replacing text using OpenCode tools."""
     async def run_edit():
-        register_all_tools()
-        context = ToolContext(session_id="cli", project_dir=".")
+        _ensure_tools()
+        context = _tool_ctx()
         registry = get_registry()
         result = await registry.execute("edit", {"path": path, "old_string": old_string, "new_string": new_string}, context)
         if result.get("success"):
@@ -662,16 +746,17 @@ def grep(
 ) -> None:
     """Search for patterns in files using OpenCode tools."""
     async def run_grep():
-        register_all_tools()
-        context = ToolContext(session_id="cli", project_dir=".")
+        _ensure_tools()
+        context = _tool_ctx()
         registry = get_registry()
         result = await registry.execute("grep", {"pattern": pattern, "path": path, "file_pattern": file_pattern}, context)
         matches = result.get("matches", [])
         if not matches:
             typer.echo("No matches found")
             return
-        for match in matches:
-            typer.echo(f"{match['path']}:{match['line']}: {match['content']}")
+        sys.stdout.write(
+            "".join(f"{match['path']}:{match['line']}: {match['content']}\n" for match in matches)
+        )
     
     asyncio.run(run_grep())
 
@@ -683,8 +768,8 @@ def glob(
 ) -> None:
     """Find files matching a glob pattern using OpenCode tools."""
     async def run_glob():
-        register_all_tools()
-        context = ToolContext(session_id="cli", project_dir=".")
+        _ensure_tools()
+        context = _tool_ctx()
         registry = get_registry()
         result = await registry.execute("glob", {"pattern": pattern, "path": path}, context)
         files = result.get("files", [])
@@ -703,16 +788,17 @@ def list_dir(
 ) -> None:
     """List directory contents."""
     async def run_ls():
-        register_all_tools()
-        context = ToolContext(session_id="cli", project_dir=".")
+        _ensure_tools()
+        context = _tool_ctx()
         registry = get_registry()
         result = await registry.execute("ls", {"path": path}, context)
         if result.get("error"):
             typer.echo(f"Error: {result['error']}", err=True)
             sys.exit(1)
+        icons = _ENTRY_ICONS
+        out = sys.stdout.write
         for entry in result.get("entries", []):
-            icon = "📁" if entry["type"] == "directory" else "📄"
-            typer.echo(f"{icon} {entry['name']}")
+            out(f"{icons.get(entry['type'], '📄')} {entry['name']}\n")
     
     asyncio.run(run_ls())
 
@@ -731,13 +817,15 @@ def config() -> None:
     from opencode.global_path import get_paths
     
     paths = get_paths()
-    typer.echo("OpenCode Configuration")
-    typer.echo("=" * 50)
-    typer.echo(f"Data directory:    {paths.data}")
-    typer.echo(f"Config directory:  {paths.config}")
-    typer.echo(f"Cache directory:   {paths.cache}")
-    typer.echo(f"State directory:   {paths.state}")
-    typer.echo(f"Log directory:     {paths.log}")
+    sys.stdout.write(
+        "OpenCode Configuration\n"
+        f"{'=' * 50}\n"
+        f"Data directory:    {paths.data}\n"
+        f"Config directory:  {paths.config}\n"
+        f"Cache directory:   {paths.cache}\n"
+        f"State directory:   {paths.state}\n"
+        f"Log directory:     {paths.log}\n"
+    )
 
 
 # Auth commands
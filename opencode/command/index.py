@@ -1,6 +1,11 @@
 """Command system implementation."""
 
+import asyncio
+import os
 import re
+import shlex
+from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
@@ -10,6 +15,53 @@ from opencode.util import create as create_logger
 
 log = create_logger({"service": "command"})
 
+# Matches `{name}` placeholders in command templates
+_PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
+
+# Characters that need a shell to interpret (pipes, redirects, expansions, globs, ...)
+_SHELL_META_RE = re.compile(r"[|&;<>()$`\\*?\[\]#~=%!{}\n]")
+
+# Fenced ``` blocks holding the template in command files
+_CMD_BLOCK_RE = re.compile(r"^[ \t]*```[ \t\r]*\n(.*?)^[ \t]*```[ \t\r]*$", re.DOTALL | re.MULTILINE)
+
+# Parsed command files by path, with the (mtime_ns, size) they were parsed at
+_file_cache: dict[str, tuple[int, int, "_CommandInfo"]] = {}
+
+
+@dataclass
+class ExecResult:
+    """Result of executing a command.
+    
+    Output is kept as bytes and only decoded when ``stdout``/``stderr`` are read.
+    """
+    stdout_bytes: bytes
+    stderr_bytes: bytes
+    exit_code: int | None
+    
+    @cached_property
+    def stdout(self) -> str:
+        """Decoded standard output."""
+        return self.stdout_bytes.decode()
+    
+    @cached_property
+    def stderr(self) -> str:
+        """Decoded standard error."""
+        return self.stderr_bytes.decode()
+    
+    def __getitem__(self, key: str) -> Any:
+        """Allow dict-style access for callers of the old dict result."""
+        return getattr(self, key)
+
+
+def _split_command(cmd_string: str) -> list[str] | None:
+    """Split a command into argv, or return None if it needs a shell."""
+    if _SHELL_META_RE.search(cmd_string):
+        return None
+    try:
+        return shlex.split(cmd_string)
+    except ValueError:
+        return None
+
 
 class CommandArgument(BaseModel):
     """Command argument definition."""
@@ -32,22 +84,56 @@ class CommandInfo(BaseModel):
     env: dict[str, str] = Field(default_factory=dict, description="Environment variables")
 
 
+@dataclass(slots=True, frozen=True)
+class _CommandInfo:
+    """Registered command, already validated.
+    
+    Has the same fields as CommandInfo but skips Pydantic on the registry path.
+    """
+    name: str
+    description: str
+    template: str
+    arguments: tuple[CommandArgument, ...] = ()
+    cwd: str | None = None
+    env: dict[str, str] = field(default_factory=dict)
+    # Subprocess environment: None inherits ours, else os.environ + env at registration
+    exec_env: dict[str, str] | None = field(init=False, default=None)
+    
+    def __post_init__(self) -> None:
+        if self.env:
+            object.__setattr__(self, "exec_env", {**os.environ, **self.env})
+    
+    @classmethod
+    def from_model(cls, command: CommandInfo) -> "_CommandInfo":
+        """Convert a public CommandInfo into its registry form."""
+        return cls(
+            name=command.name,
+            description=command.description,
+            template=command.template,
+            arguments=tuple(command.arguments),
+            cwd=command.cwd,
+            env=dict(command.env),
+        )
+
+
 class CommandRegistry:
     """Registry for commands."""
     
     def __init__(self) -> None:
-        self._commands: dict[str, CommandInfo] = {}
+        self._commands: dict[str, _CommandInfo] = {}
     
-    def register(self, command: CommandInfo) -> None:
+    def register(self, command: CommandInfo | _CommandInfo) -> None:
         """Register a command."""
+        if isinstance(command, CommandInfo):
+            command = _CommandInfo.from_model(command)
         self._commands[command.name] = command
         log.info("Registered command", {"name": command.name})
     
-    def get(self, name: str) -> CommandInfo | None:
+    def get(self, name: str) -> _CommandInfo | None:
         """Get a command by name."""
         return self._commands.get(name)
     
-    def list_commands(self) -> list[CommandInfo]:
+    def list_commands(self) -> list[_CommandInfo]:
         """List all registered commands."""
         return list(self._commands.values())
     
@@ -67,13 +153,14 @@ class CommandExecutor:
     
     def _substitute_template(self, template: str, args: dict[str, Any]) -> str:
         """Substitute arguments into template."""
-        result = template
-        for key, value in args.items():
-            placeholder = f"{{{key}}}"
-            result = result.replace(placeholder, str(value))
-        return result
+        if "{" not in template:
+            return template
+        return _PLACEHOLDER_RE.sub(
+            lambda m: str(args[m.group(1)]) if m.group(1) in args else m.group(0),
+            template,
+        )
     
-    async def execute(self, name: str, **kwargs: Any) -> dict[str, Any]:
+    async def execute(self, name: str, **kwargs: Any) -> ExecResult:
         """Execute a command with arguments."""
         command = self.registry.get(name)
         if not command:
@@ -89,27 +176,78 @@ class CommandExecutor:
         
         log.info("Executing command", {"name": name, "command": cmd_string})
         
-        import asyncio
+        # Execute command, skipping the shell when it has nothing to interpret
+        env = command.exec_env
+        argv = _split_command(cmd_string)
+        proc = None
+        if argv:
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    *argv,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    cwd=command.cwd,
+                    env=env,
+                )
+            except OSError:
+                # Missing, non-executable or directory argv[0]: let the shell
+                # report it with its usual 127/126 result
+                proc = None
+        if proc is None:
+            proc = await asyncio.create_subprocess_shell(
+                cmd_string,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=command.cwd,
+                env=env,
+            )
         
-        # Execute command
-        proc = await asyncio.create_subprocess_shell(
-            cmd_string,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            cwd=command.cwd,
-            env={**dict(), **command.env},
+        stdout, stderr = await proc.communicate()
+        
+        return ExecResult(
+            stdout_bytes=stdout,
+            stderr_bytes=stderr,
+            exit_code=proc.returncode,
         )
+    
+    async def execute_many(
+        self,
+        calls: list[tuple[str, dict[str, Any]]],
+        concurrency: int | None = None,
+    ) -> list[ExecResult]:
+        """Execute independent commands concurrently.
         
-        stdout, stderr = await proc.communicate()
+        Args:
+            calls: (command name, arguments) pairs
+            concurrency: Maximum commands running at once (defaults to CPU count)
+            
+        Returns:
+            Results in the same order as ``calls``
+        """
+        semaphore = asyncio.Semaphore(concurrency or os.cpu_count() or 4)
         
-        return {
-            "stdout": stdout.decode(),
-            "stderr": stderr.decode(),
-            "exit_code": proc.returncode,
-        }
+        async def run_one(name: str, kwargs: dict[str, Any]) -> ExecResult:
+            async with semaphore:
+                return await self.execute(name, **kwargs)
+        
+        return await asyncio.gather(*(run_one(name, kwargs) for name, kwargs in calls))
     
-    async def execute_from_file(self, file_path: Path, **kwargs: Any) -> dict[str, Any]:
+    async def execute_from_file(self, file_path: Path, **kwargs: Any) -> ExecResult:
         """Execute a command defined in a file."""
+        st = os.stat(file_path)
+        cached = _file_cache.get(str(file_path))
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            command = cached[2]
+        else:
+            command = self._parse_file(file_path)
+            _file_cache[str(file_path)] = (st.st_mtime_ns, st.st_size, command)
+        
+        if self.registry.get(command.name) is not command:
+            self.registry.register(command)
+        return await self.execute(command.name, **kwargs)
+    
+    def _parse_file(self, file_path: Path) -> _CommandInfo:
+        """Parse a command definition file."""
         content = file_path.read_text()
         
         # Parse command from content
@@ -119,27 +257,15 @@ class CommandExecutor:
         #         command template
         #         ```
         
-        lines = content.split("\n")
-        name = lines[0].lstrip("# ").strip() if lines else "unnamed"
-        
-        # Find command block
-        template = ""
-        in_block = False
-        for line in lines[1:]:
-            if line.strip() == "```":
-                in_block = not in_block
-                continue
-            if in_block:
-                template += line + "\n"
+        first_line, _, body = content.partition("\n")
+        name = first_line.lstrip("# ").strip()
+        template = "".join(_CMD_BLOCK_RE.findall(body))
         
-        command = CommandInfo(
+        return _CommandInfo(
             name=name,
             description=content,
             template=template.strip(),
         )
-        
-        self.registry.register(command)
-        return await self.execute(name, **kwargs)
 
 
 # Global registry
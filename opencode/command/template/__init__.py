@@ -1,9 +1,13 @@
 """Command template module for opencode."""
 
+import re
 from typing import Any
 
 from pydantic import BaseModel, Field
 
+# Matches `{name}` placeholders in template content
+_PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
+
 
 class Template(BaseModel):
     """Command template."""
@@ -13,7 +17,11 @@ class Template(BaseModel):
 
 async def render(template: Template, **kwargs: Any) -> str:
     """Render a template with variables."""
-    content = template.content
-    for key, value in kwargs.items():
-        content = content.replace(f"{{{key}}}", str(value))
-    return content
+    if "{" not in template.content:
+        return template.content
+    # Literal {name} substitution only; no format-spec, conversion or attribute access
+    values = {k: str(v) for k, v in kwargs.items()}
+    return _PLACEHOLDER_RE.sub(
+        lambda m: values.get(m.group(1), m.group(0)),
+        template.content,
+    )
@@ -1,14 +1,31 @@
 """Command templates."""
 
+import functools
+import os
+import re
+import sys
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from opencode.util import create as create_logger
 
 log = create_logger({"service": "command", "component": "template"})
 
+# Matches `{name}` placeholders in command templates
+_PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
+
+# `---` delimited blocks holding the command in template files
+_TMPL_BLOCK_RE = re.compile(r"^[ \t]*---[ \t\r]*\n(.*?)^[ \t]*---[ \t\r]*$", re.DOTALL | re.MULTILINE)
+
+# First non-blank line, stripped
+_TEXT_LINE_RE = re.compile(r"^[ \t]*(\S[^\n]*?)[ \t\r]*$", re.MULTILINE)
+
+# Parsed template files by path, with the (mtime_ns, size) they were parsed at
+_file_cache: dict[str, tuple[int, int, "CommandTemplate"]] = {}
+
 
 class CommandTemplate(BaseModel):
     """A command template definition."""
@@ -16,8 +33,38 @@ class CommandTemplate(BaseModel):
     name: str = Field(description="Template name")
     description: str = Field(description="Template description")
     template: str = Field(description="Command template string")
-    variables: list[str] = Field(default_factory=list, description="Template variables")
+    variables: tuple[str, ...] = Field(default=(), description="Template variables")
     example: str | None = Field(default=None, description="Usage example")
+    
+    # Render function specialized for `template`, refreshed by TemplateManager.register
+    _compiled: Callable[[dict[str, Any]], str] = PrivateAttr()
+    
+    def model_post_init(self, __context: Any) -> None:
+        """Compile the template string."""
+        self._compiled = _compile(self.template)
+
+
+def _compile(template: str) -> Callable[[dict[str, Any]], str]:
+    """Build a render function for a template string.
+    
+    The template is split once into literal text and placeholder names, so
+    rendering is a single join. Unknown placeholders are left as-is.
+    """
+    parts = _PLACEHOLDER_RE.split(template)
+    if len(parts) == 1:
+        return lambda variables: template
+    
+    literals = tuple(sys.intern(part) for part in parts[0::2])
+    names = tuple(sys.intern(part) for part in parts[1::2])
+    
+    def render(variables: dict[str, Any]) -> str:
+        out = [literals[0]]
+        for name, literal in zip(names, literals[1:], strict=True):
+            out.append(str(variables[name]) if name in variables else "{" + name + "}")
+            out.append(literal)
+        return "".join(out)
+    
+    return render
 
 
 class TemplateManager:
@@ -25,6 +72,7 @@ class TemplateManager:
     
     def __init__(self) -> None:
         self._templates: dict[str, CommandTemplate] = {}
+        self._render_cached = functools.lru_cache(maxsize=256)(self._render)
         self._init_default_templates()
     
     def _init_default_templates(self) -> None:
@@ -33,7 +81,7 @@ class TemplateManager:
             name="test",
             description="Run project tests",
             template="{package_manager} test",
-            variables=["package_manager"],
+            variables=("package_manager",),
             example="npm test",
         ))
         
@@ -41,7 +89,7 @@ class TemplateManager:
             name="build",
             description="Build the project",
             template="{package_manager} run build",
-            variables=["package_manager"],
+            variables=("package_manager",),
             example="npm run build",
         ))
         
@@ -49,7 +97,7 @@ class TemplateManager:
             name="lint",
             description="Run linter",
             template="{package_manager} run lint",
-            variables=["package_manager"],
+            variables=("package_manager",),
             example="npm run lint",
         ))
         
@@ -57,7 +105,7 @@ class TemplateManager:
             name="install",
             description="Install dependencies",
             template="{package_manager} install",
-            variables=["package_manager"],
+            variables=("package_manager",),
             example="npm install",
         ))
         
@@ -65,13 +113,15 @@ class TemplateManager:
             name="dev",
             description="Start development server",
             template="{package_manager} run dev",
-            variables=["package_manager"],
+            variables=("package_manager",),
             example="npm run dev",
         ))
     
     def register(self, template: CommandTemplate) -> None:
         """Register a command template."""
-        self._templates[template.name] = template
+        template._compiled = _compile(template.template)
+        self._templates[sys.intern(template.name)] = template
+        self._render_cached.cache_clear()
         log.info("Registered template", {"name": template.name})
     
     def get(self, name: str) -> CommandTemplate | None:
@@ -80,15 +130,16 @@ class TemplateManager:
     
     def render(self, name: str, **kwargs: Any) -> str:
         """Render a template with variables."""
-        template = self.get(name)
-        if not template:
+        if name not in self._templates:
             raise ValueError(f"Template not found: {name}")
         
-        result = template.template
-        for key, value in kwargs.items():
-            result = result.replace(f"{{{key}}}", str(value))
-        
-        return result
+        # Rendering only uses str(value); keying on it keeps 1, True and 1.0 apart
+        items = tuple(sorted((key, str(value)) for key, value in kwargs.items()))
+        return self._render_cached(name, items)
+    
+    def _render(self, name: str, items: tuple[tuple[str, str], ...]) -> str:
+        """Render a registered template with the given variable items."""
+        return self._templates[name]._compiled(dict(items))
     
     def list_templates(self) -> list[CommandTemplate]:
         """List all registered templates."""
@@ -96,6 +147,20 @@ class TemplateManager:
     
     def load_from_file(self, file_path: Path) -> CommandTemplate:
         """Load a template from a file."""
+        st = os.stat(file_path)
+        cached = _file_cache.get(str(file_path))
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            cmd_template = cached[2]
+        else:
+            cmd_template = self._parse_file(file_path)
+            _file_cache[str(file_path)] = (st.st_mtime_ns, st.st_size, cmd_template)
+        
+        if self._templates.get(cmd_template.name) is not cmd_template:
+            self.register(cmd_template)
+        return cmd_template
+    
+    def _parse_file(self, file_path: Path) -> CommandTemplate:
+        """Parse a template definition file."""
         content = file_path.read_text()
         
         # Parse template file
@@ -106,36 +171,22 @@ class TemplateManager:
         # command template here
         # ---
         
-        lines = content.split("\n")
-        name = lines[0].lstrip("# ").strip() if lines else "unnamed"
-        
-        description = ""
-        template_str = ""
+        first_line, _, body = content.partition("\n")
+        name = first_line.lstrip("# ").strip()
+        template_str = "".join(_TMPL_BLOCK_RE.findall(body))
         
-        in_template = False
-        for line in lines[1:]:
-            if line.strip() == "---":
-                in_template = not in_template
-                continue
-            
-            if in_template:
-                template_str += line + "\n"
-            elif line.strip() and not description:
-                description = line.strip()
+        description_match = _TEXT_LINE_RE.search(_TMPL_BLOCK_RE.sub("", body))
+        description = description_match.group(1) if description_match else ""
         
         # Extract variables from template
-        import re
-        variables = re.findall(r"\{(\w+)\}", template_str)
+        variables = tuple(dict.fromkeys(_PLACEHOLDER_RE.findall(template_str)))
         
-        cmd_template = CommandTemplate(
+        return CommandTemplate(
             name=name.lower().replace(" ", "_"),
             description=description,
             template=template_str.strip(),
-            variables=list(set(variables)),
+            variables=variables,
         )
-        
-        self.register(cmd_template)
-        return cmd_template
 
 
 # Global instance
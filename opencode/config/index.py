@@ -1,13 +1,30 @@
 """Configuration management for opencode."""
 
+import asyncio
 import os
+from enum import StrEnum
 from pathlib import Path
 from typing import Any
 
 from pydantic import BaseModel, Field
 
+from opencode.config.util import json_loads
 
-class PermissionAction(str):
+
+def _default_username() -> str:
+    """Get the login name of the current user."""
+    try:
+        login = os.getlogin()
+    except (AttributeError, OSError):
+        # getlogin() fails without a controlling terminal (daemons, some launchers)
+        login = None
+    return login or os.environ.get("USER") or os.environ.get("USERNAME") or "user"
+
+
+_DEFAULT_USERNAME = _default_username()
+
+
+class PermissionAction(StrEnum):
     """Permission action type."""
     ASK = "ask"
     ALLOW = "allow"
@@ -18,7 +35,7 @@ class PermissionRule(BaseModel):
     """Permission rule configuration."""
     permission: str = Field(description="Permission name")
     pattern: str = Field(default="*", description="Pattern to match")
-    action: str = Field(default="ask", description="Action to take")
+    action: PermissionAction = Field(default=PermissionAction.ASK, description="Action to take")
 
 
 class McpLocal(BaseModel):
@@ -190,16 +207,40 @@ class ConfigInfo(BaseModel):
 
 
 _config: ConfigInfo | None = None
+_config_lock = asyncio.Lock()
 
 
 async def get() -> ConfigInfo:
     """Get the current configuration."""
     global _config
-    if _config is None:
-        _config = await load()
+    if _config is not None:
+        return _config
+    async with _config_lock:
+        if _config is None:
+            _config = await load()
     return _config
 
 
+async def _load_config_files(config_paths: list[Path]) -> list[dict[str, Any]]:
+    """Load config files concurrently, skipping missing or invalid ones.
+    
+    Results are returned in the same order as ``config_paths`` so callers
+    can merge them with the intended precedence.
+    """
+    from opencode.config.util import load_json_with_env_substitution
+    
+    def load_one(config_path: Path) -> dict[str, Any] | None:
+        try:
+            return load_json_with_env_substitution(config_path)
+        except Exception:
+            return None
+    
+    results = await asyncio.gather(
+        *(asyncio.to_thread(load_one, config_path) for config_path in config_paths)
+    )
+    return [data for data in results if data is not None]
+
+
 async def load() -> ConfigInfo:
     """Load configuration from various sources.
     
@@ -212,7 +253,6 @@ async def load() -> ConfigInfo:
     6. Inline config (OPENCODE_CONFIG_CONTENT)
     """
     from opencode.global_path import get_paths
-    from opencode.util import filesystem
     from opencode.config.util import (
         find_up, 
         deep_merge, 
@@ -233,14 +273,12 @@ async def load() -> ConfigInfo:
         pass
     
     # 2. Load global config
-    for filename in ["config.json", "opencode.json", "opencode.jsonc"]:
-        config_path = paths.config / filename
-        if await filesystem.exists(config_path):
-            try:
-                data = load_json_with_env_substitution(config_path)
-                result = deep_merge(result, data)
-            except Exception:
-                pass
+    global_files = [
+        paths.config / filename
+        for filename in ["config.json", "opencode.json", "opencode.jsonc"]
+    ]
+    for data in await _load_config_files(global_files):
+        result = deep_merge(result, data)
     
     # 2. Load project config (search up from cwd)
     # Find git root to stop at
@@ -256,12 +294,8 @@ async def load() -> ConfigInfo:
     # Search up directory tree for config files
     config_files = find_up(["opencode.jsonc", "opencode.json"], cwd, git_root)
     # Reverse to load from farthest to closest (proper precedence)
-    for config_path in reversed(config_files):
-        try:
-            data = load_json_with_env_substitution(config_path)
-            result = deep_merge(result, data)
-        except Exception:
-            pass
+    for data in await _load_config_files(list(reversed(config_files))):
+        result = deep_merge(result, data)
     
     # 3. Load .opencode directory configs
     opencode_dirs = find_up([".opencode"], cwd, git_root)
@@ -270,15 +304,13 @@ async def load() -> ConfigInfo:
     if home_opencode.exists():
         opencode_dirs.append(home_opencode)
     
-    for opencode_dir in reversed(opencode_dirs):
-        for filename in ["opencode.jsonc", "opencode.json"]:
-            config_path = opencode_dir / filename
-            if config_path.exists():
-                try:
-                    data = load_json_with_env_substitution(config_path)
-                    result = deep_merge(result, data)
-                except Exception:
-                    pass
+    dir_files = [
+        opencode_dir / filename
+        for opencode_dir in reversed(opencode_dirs)
+        for filename in ["opencode.jsonc", "opencode.json"]
+    ]
+    for data in await _load_config_files(dir_files):
+        result = deep_merge(result, data)
     
     # 4. Handle OPENCODE_CONFIG environment variable (custom config path)
     custom_config = os.environ.get("OPENCODE_CONFIG")
@@ -295,8 +327,7 @@ async def load() -> ConfigInfo:
     inline_config = os.environ.get("OPENCODE_CONFIG_CONTENT")
     if inline_config:
         try:
-            import json
-            data = json.loads(inline_config)
+            data = json_loads(inline_config)
             data = substitute_env_vars_in_config(data)
             result = deep_merge(result, data)
         except Exception:
@@ -304,9 +335,9 @@ async def load() -> ConfigInfo:
     
     # Set defaults
     if not result.get("username"):
-        result["username"] = os.getlogin() if hasattr(os, "getlogin") else "user"
+        result["username"] = _DEFAULT_USERNAME
     
-    return ConfigInfo(**result)
+    return ConfigInfo.model_validate(result)
 
 
 async def reload() -> ConfigInfo:
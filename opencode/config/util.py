@@ -1,7 +1,9 @@
 """Configuration utilities for deep merging and file discovery."""
 
+import asyncio
 import os
 import re
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
@@ -11,6 +13,23 @@ try:
 except ImportError:
     HAS_HTTPX = False
 
+# Shared JSON parser: orjson when installed, else the stdlib
+json_loads: Callable[[str | bytes], Any]
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    import json
+    json_loads = json.loads
+
+# Matches {env:VAR_NAME} or {env:VAR_NAME:default}
+_ENV_PATTERN = re.compile(r"\{env:([^}]+)\}")
+_ENV_SUB = _ENV_PATTERN.sub
+
+# JSONC `//` and `/* */` comments. String literals are matched first and
+# captured so that comment markers inside them (e.g. URLs) are kept.
+_JSONC_COMMENT_RE = re.compile(r'("(?:\\.|[^"\\])*")|//[^\n]*|/\*.*?\*/', re.DOTALL)
+
 
 def find_up(filenames: list[str], start_dir: Path, stop_dir: Path | None = None) -> list[Path]:
     """Find files by searching up the directory tree.
@@ -25,19 +44,26 @@ def find_up(filenames: list[str], start_dir: Path, stop_dir: Path | None = None)
     """
     found = []
     current = start_dir.resolve()
-    stop = stop_dir.resolve() if stop_dir else Path("/").resolve()
+    stop = str(stop_dir.resolve() if stop_dir else Path("/").resolve())
     
     while True:
+        # One directory listing per level instead of a stat per filename
+        try:
+            with os.scandir(current) as it:
+                entries = {entry.name for entry in it}
+        except OSError:
+            entries = set()
+        
         for filename in filenames:
-            filepath = current / filename
-            if filepath.exists():
-                found.append(filepath)
+            if filename in entries:
+                found.append(current / filename)
         
         # Stop if we've reached the stop directory or root
-        if current == stop or current.parent == current:
+        parent = current.parent
+        if str(current) == stop or parent == current:
             break
             
-        current = current.parent
+        current = parent
     
     return found
 
@@ -57,20 +83,27 @@ def deep_merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]
         New merged dictionary
     """
     result = dict(base)
+    # (target, override) pairs still to merge; targets are already copies
+    stack = [(result, override)]
     
-    for key, value in override.items():
-        if key in result:
-            if isinstance(result[key], dict) and isinstance(value, dict):
-                # Recursively merge nested dicts
-                result[key] = deep_merge(result[key], value)
-            elif isinstance(result[key], list) and isinstance(value, list):
-                # Concatenate lists
-                result[key] = result[key] + value
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            if key in target:
+                existing = target[key]
+                if isinstance(existing, dict) and isinstance(value, dict):
+                    # Copy only the subtree being merged into
+                    merged = dict(existing)
+                    target[key] = merged
+                    stack.append((merged, value))
+                elif isinstance(existing, list) and isinstance(value, list):
+                    # Concatenate lists
+                    target[key] = existing + value
+                else:
+                    # Overwrite other values
+                    target[key] = value
             else:
-                # Overwrite other values
-                result[key] = value
-        else:
-            result[key] = value
+                target[key] = value
     
     return result
 
@@ -86,6 +119,9 @@ def substitute_env_vars(text: str) -> str:
     Returns:
         Text with environment variables substituted
     """
+    if "{env:" not in text:
+        return text
+    
     def replace_env(match: re.Match) -> str:
         env_spec = match.group(1)
         if ":" in env_spec:
@@ -96,9 +132,7 @@ def substitute_env_vars(text: str) -> str:
             value = os.environ.get(env_spec)
             return value if value is not None else ""
     
-    # Pattern matches {env:VAR_NAME} or {env:VAR_NAME:default}
-    pattern = r'\{env:([^}]+)\}'
-    return re.sub(pattern, replace_env, text)
+    return _ENV_SUB(replace_env, text)
 
 
 def substitute_env_vars_in_config(config: Any) -> Any:
@@ -108,12 +142,27 @@ def substitute_env_vars_in_config(config: Any) -> Any:
         config: Config value (dict, list, or primitive)
         
     Returns:
-        Config with environment variables substituted
+        Config with environment variables substituted. Containers with
+        nothing to substitute are returned as-is rather than copied.
     """
     if isinstance(config, dict):
-        return {k: substitute_env_vars_in_config(v) for k, v in config.items()}
+        result = None
+        for k, v in config.items():
+            new_v = substitute_env_vars_in_config(v)
+            if new_v is not v:
+                if result is None:
+                    result = dict(config)
+                result[k] = new_v
+        return config if result is None else result
     elif isinstance(config, list):
-        return [substitute_env_vars_in_config(item) for item in config]
+        items = None
+        for i, item in enumerate(config):
+            new_item = substitute_env_vars_in_config(item)
+            if new_item is not item:
+                if items is None:
+                    items = list(config)
+                items[i] = new_item
+        return config if items is None else items
     elif isinstance(config, str):
         return substitute_env_vars(config)
     else:
@@ -129,22 +178,22 @@ def load_json_with_env_substitution(filepath: Path) -> dict[str, Any]:
     Returns:
         Parsed and substituted config dict
     """
-    import json
+    data = filepath.read_bytes()
+    
+    # Plain JSON with nothing to substitute can be parsed straight from bytes
+    if filepath.suffix != ".jsonc" and b"{env:" not in data:
+        return json_loads(data)
     
-    content = filepath.read_text(encoding="utf-8")
+    content = data.decode("utf-8")
     
     # Handle JSONC (remove comments)
     if filepath.suffix == ".jsonc":
-        lines = content.split("\n")
-        content = "\n".join(
-            line for line in lines 
-            if not line.strip().startswith("//")
-        )
+        content = _JSONC_COMMENT_RE.sub(r"\1", content)
     
     # Substitute environment variables before parsing
     content = substitute_env_vars(content)
     
-    return json.loads(content)
+    return json_loads(content)
 
 
 async def load_remote_config(url: str) -> dict[str, Any]:
@@ -156,25 +205,28 @@ async def load_remote_config(url: str) -> dict[str, Any]:
     Returns:
         Config dict from remote, or empty dict if failed
     """
-    import json
-    
     if not HAS_HTTPX:
         return {}
     
+    async with httpx.AsyncClient(timeout=10.0) as client:
+        return await _fetch_remote_config(client, url)
+
+
+async def _fetch_remote_config(client: "httpx.AsyncClient", url: str) -> dict[str, Any]:
+    """Fetch a remote .well-known/opencode config using an existing client."""
     # Construct well-known URL
     well_known_url = f"{url.rstrip('/')}/.well-known/opencode"
     
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(well_known_url)
-            if response.status_code == 200:
-                data = response.json()
-                # Extract config from well-known response
-                config = data.get("config", {})
-                # Add $schema if missing to prevent rewrites
-                if "$schema" not in config:
-                    config["$schema"] = "https://opencode.ai/config.json"
-                return config
+        response = await client.get(well_known_url)
+        if response.status_code == 200:
+            data = response.json()
+            # Extract config from well-known response
+            config = data.get("config", {})
+            # Add $schema if missing to prevent rewrites
+            if "$schema" not in config:
+                config["$schema"] = "https://opencode.ai/config.json"
+            return config
     except Exception:
         # Silently fail on any error (network, parse, etc.)
         pass
@@ -185,25 +237,32 @@ async def load_remote_config(url: str) -> dict[str, Any]:
 async def load_remote_configs_from_env() -> dict[str, Any]:
     """Load remote configs from OPENCODE_REMOTE_CONFIG env var.
     
-    Supports multiple URLs separated by commas.
+    Supports multiple URLs separated by commas. They are fetched
+    concurrently over one pooled client and merged in the listed order.
     Format: "https://company1.com,https://company2.com"
     
     Returns:
         Merged config from all remote sources
     """
-    import os
-    
     remote_urls = os.environ.get("OPENCODE_REMOTE_CONFIG", "")
-    if not remote_urls:
+    if not remote_urls or not HAS_HTTPX:
         return {}
     
-    result: dict[str, Any] = {}
+    urls = [url.strip() for url in remote_urls.split(",") if url.strip()]
+    if not urls:
+        return {}
     
-    for url in remote_urls.split(","):
-        url = url.strip()
-        if url:
-            remote_config = await load_remote_config(url)
-            if remote_config:
-                result = deep_merge(result, remote_config)
+    async with httpx.AsyncClient(
+        timeout=10.0,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+    ) as client:
+        remote_configs = await asyncio.gather(
+            *(_fetch_remote_config(client, url) for url in urls)
+        )
+    
+    result: dict[str, Any] = {}
+    for remote_config in remote_configs:
+        if remote_config:
+            result = deep_merge(result, remote_config)
     
     return result
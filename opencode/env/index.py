@@ -1,6 +1,8 @@
 """Environment variable management."""
 
 import os
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 
@@ -11,51 +13,35 @@ class EnvManager:
         # Create a shallow copy to isolate environment per instance
         # Prevents parallel tests from interfering with each other's env vars
         self._env = dict(os.environ)
+        # Read-only view handed out by all(); dropped whenever _env changes
+        self._snapshot: Mapping[str, str] | None = None
 
     def get(self, key: str) -> str | None:
         """Get an environment variable."""
         return self._env.get(key)
 
-    def all(self) -> dict[str, str]:
-        """Get all environment variables."""
-        return dict(self._env)
+    def all(self) -> Mapping[str, str]:
+        """Get a read-only snapshot of all environment variables."""
+        if self._snapshot is None:
+            self._snapshot = MappingProxyType(dict(self._env))
+        return self._snapshot
 
     def set(self, key: str, value: str) -> None:
         """Set an environment variable."""
         self._env[key] = value
+        self._snapshot = None
 
     def remove(self, key: str) -> None:
         """Remove an environment variable."""
         self._env.pop(key, None)
+        self._snapshot = None
 
 
-# Global instance
-_env_instance: EnvManager | None = None
+# Global instance, created eagerly so the module-level helpers below are
+# plain bound methods with no per-call lookup
+_env_instance = EnvManager()
 
-
-def _get_instance() -> EnvManager:
-    """Get or create the global EnvManager instance."""
-    global _env_instance
-    if _env_instance is None:
-        _env_instance = EnvManager()
-    return _env_instance
-
-
-def get(key: str) -> str | None:
-    """Get an environment variable."""
-    return _get_instance().get(key)
-
-
-def all() -> dict[str, str]:
-    """Get all environment variables."""
-    return _get_instance().all()
-
-
-def set(key: str, value: str) -> None:
-    """Set an environment variable."""
-    _get_instance().set(key, value)
-
-
-def remove(key: str) -> None:
-    """Remove an environment variable."""
-    _get_instance().remove(key)
+get = _env_instance.get
+all = _env_instance.all
+set = _env_instance.set
+remove = _env_instance.remove
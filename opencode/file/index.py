@@ -1,20 +1,34 @@
 """File operations module."""
 
-import base64
+import asyncio
+import binascii
 import fnmatch
 import mimetypes
 import os
-import subprocess
+import re
+import time
+from collections.abc import Callable
 from pathlib import Path
 from typing import List, Literal
 
 from pydantic import BaseModel, Field
 
+try:
+    import pathspec
+    HAS_PATHSPEC = True
+except ImportError:
+    HAS_PATHSPEC = False
+
 from opencode.bus import get_bus
 from opencode.util import create as create_logger
 
 log = create_logger({"service": "file"})
 
+# How long a search scan of the project tree is reused before rescanning
+_SEARCH_CACHE_TTL = 5.0
+# How long the set of changed paths used by read() is reused
+_DIRTY_CACHE_TTL = 2.0
+
 
 class FileInfo(BaseModel):
     """Information about a changed file."""
@@ -68,7 +82,7 @@ class FileContent(BaseModel):
 
 
 # Binary file extensions
-binary_extensions = {
+binary_extensions = frozenset({
     "exe", "dll", "pdb", "bin", "so", "dylib", "o", "a", "lib",
     "wav", "mp3", "ogg", "oga", "ogv", "ogx", "flac", "aac",
     "wma", "m4a", "weba", "mp4", "avi", "mov", "wmv", "flv",
@@ -82,14 +96,14 @@ binary_extensions = {
     "vdex", "odex", "oat", "art", "wasm", "wat", "bc", "ll",
     "s", "ko", "sys", "drv", "efi", "rom", "com", "bat", "cmd",
     "ps1", "sh", "bash", "zsh", "fish",
-}
+})
 
 # Image file extensions
-image_extensions = {
+image_extensions = frozenset({
     "png", "jpg", "jpeg", "gif", "bmp", "webp", "ico", "tif",
     "tiff", "svg", "svgz", "avif", "apng", "jxl", "heic", "heif",
     "raw", "cr2", "nef", "arw", "dng", "orf", "raf", "pef", "x3f",
-}
+})
 
 # MIME types for images
 image_mime_types = {
@@ -111,23 +125,38 @@ image_mime_types = {
     "heif": "image/heif",
 }
 
+# Extension (no dot, lowercase) to MIME type, built once from the mimetypes
+# registry so lookups are a dict hit instead of a guess_type() call
+mimetypes.init()
+_MIME_BY_EXT = {ext[1:].lower(): mime for ext, mime in mimetypes.types_map.items()}
+
+
+def _ext(filepath: str) -> str:
+    """Get a path's lowercased extension without the dot, like Path.suffix."""
+    start = filepath.rfind("/") + 1
+    if os.sep != "/":
+        start = max(start, filepath.rfind(os.sep) + 1)
+    dot = filepath.rfind(".", start)
+    # A leading dot (".gitignore") is part of the name, not an extension
+    if dot <= start:
+        return ""
+    return filepath[dot + 1:].lower()
+
 
 def is_image_by_extension(filepath: str) -> bool:
     """Check if a file is an image by its extension."""
-    ext = Path(filepath).suffix.lower().lstrip(".")
-    return ext in image_extensions
+    return _ext(filepath) in image_extensions
 
 
 def get_image_mime_type(filepath: str) -> str:
     """Get the MIME type for an image file."""
-    ext = Path(filepath).suffix.lower().lstrip(".")
+    ext = _ext(filepath)
     return image_mime_types.get(ext, f"image/{ext}")
 
 
 def is_binary_by_extension(filepath: str) -> bool:
     """Check if a file is binary by its extension."""
-    ext = Path(filepath).suffix.lower().lstrip(".")
-    return ext in binary_extensions
+    return _ext(filepath) in binary_extensions
 
 
 def is_image(mime_type: str) -> bool:
@@ -137,7 +166,7 @@ def is_image(mime_type: str) -> bool:
 
 def should_encode(file_path: Path) -> bool:
     """Determine if a file should be base64 encoded."""
-    mime_type, _ = mimetypes.guess_type(str(file_path))
+    mime_type = _MIME_BY_EXT.get(_ext(str(file_path)))
     if not mime_type:
         return False
 
@@ -150,6 +179,34 @@ def should_encode(file_path: Path) -> bool:
     return top in ("image", "audio", "video", "font", "model", "multipart")
 
 
+def _encode_base64(path: Path) -> str:
+    """Read a file and return its contents base64-encoded."""
+    # b2a_base64 encodes straight from the buffer, skipping b64encode's wrapper
+    with path.open("rb") as f:
+        return binascii.b2a_base64(memoryview(f.read()), newline=False).decode("ascii")
+
+
+def _compile_ignore_patterns(patterns: List[str]) -> re.Pattern[str] | None:
+    """Compile fnmatch-style ignore patterns into a single regex union."""
+    parts = []
+    for pattern in patterns:
+        pattern = pattern.strip()
+        if not pattern or pattern.startswith("#"):
+            continue
+        parts.append(fnmatch.translate(os.path.normcase(pattern)))
+    if not parts:
+        return None
+    return re.compile("|".join(f"(?:{part})" for part in parts))
+
+
+def _mtime_ns(path: Path) -> int | None:
+    """Get a file's modification time, or None if it doesn't exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
 class FileManager:
     """Manages file operations within a project."""
 
@@ -158,6 +215,12 @@ class FileManager:
         self.vcs = vcs
         self._cache: dict[str, List[str]] | None = None
         self._cache_fetching = False
+        self._cache_time = 0.0
+        # (unstaged, staged) changed paths, relative to the project
+        self._dirty_sets: tuple[set[str], set[str]] | None = None
+        self._dirty_time = 0.0
+        # (mtimes of .gitignore/.ignore, matcher built from them)
+        self._ignore_cache: tuple[tuple[int | None, ...], Callable[[str], bool]] | None = None
 
     def _get_ignore_patterns(self) -> List[str]:
         """Get ignore patterns from .gitignore and .ignore files."""
@@ -173,17 +236,60 @@ class FileManager:
 
         return patterns
 
-    def _is_ignored(self, path: str, patterns: List[str]) -> bool:
-        """Check if a path matches ignore patterns."""
-        for pattern in patterns:
-            pattern = pattern.strip()
-            if not pattern or pattern.startswith("#"):
-                continue
-            if fnmatch.fnmatch(path, pattern) or fnmatch.fnmatch(
-                Path(path).name, pattern
-            ):
-                return True
-        return False
+    def _get_ignore_matcher(self) -> Callable[[str], bool]:
+        """Get a matcher for the ignore files, rebuilt only when they change."""
+        key = tuple(
+            _mtime_ns(self.project_dir / name) for name in (".gitignore", ".ignore")
+        )
+        if self._ignore_cache is None or self._ignore_cache[0] != key:
+            patterns = self._get_ignore_patterns()
+            matcher: Callable[[str], bool]
+            if HAS_PATHSPEC:
+                matcher = pathspec.PathSpec.from_lines("gitwildmatch", patterns).match_file
+            else:
+                regex = _compile_ignore_patterns(patterns)
+
+                def matcher(path: str) -> bool:
+                    return self._is_ignored(path, regex)
+            self._ignore_cache = (key, matcher)
+        return self._ignore_cache[1]
+
+    def _is_ignored(self, path: str, regex: re.Pattern[str] | None) -> bool:
+        """Check if a path or its basename matches the compiled ignore patterns."""
+        if regex is None:
+            return False
+        path = os.path.normcase(path)
+        return bool(
+            regex.match(path) or regex.match(os.path.basename(path.rstrip("/")))
+        )
+
+    async def _git(self, *args: str) -> str:
+        """Run a read-only git command in the project and return its stdout."""
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "git",
+                "-c",
+                "core.quotepath=false",
+                *args,
+                cwd=self.project_dir,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            stdout, _ = await proc.communicate()
+        except Exception:
+            return ""
+        return stdout.decode(errors="replace")
+
+    async def _get_dirty_sets(self) -> tuple[set[str], set[str]]:
+        """Get the paths with unstaged and staged changes, relative to the project."""
+        if self._dirty_sets is None or time.monotonic() - self._dirty_time > _DIRTY_CACHE_TTL:
+            unstaged, staged = await asyncio.gather(
+                self._git("diff", "--name-only", "--relative"),
+                self._git("diff", "--name-only", "--relative", "--staged"),
+            )
+            self._dirty_sets = (set(unstaged.splitlines()), set(staged.splitlines()))
+            self._dirty_time = time.monotonic()
+        return self._dirty_sets
 
     async def status(self) -> List[FileInfo]:
         """Get the status of changed files in the project."""
@@ -192,97 +298,56 @@ class FileManager:
 
         changed_files: List[FileInfo] = []
 
-        # Get diff stats
-        try:
-            result = subprocess.run(
-                ["git", "-c", "core.quotepath=false", "diff", "--numstat", "HEAD"],
-                cwd=self.project_dir,
-                capture_output=True,
-                text=True,
-                check=False,
-            )
+        # The three queries are independent, so run them concurrently
+        numstat, untracked, deleted = await asyncio.gather(
+            self._git("diff", "--numstat", "HEAD"),
+            self._git("ls-files", "--others", "--exclude-standard"),
+            self._git("diff", "--name-only", "--diff-filter=D", "HEAD"),
+        )
 
-            if result.stdout.strip():
-                for line in result.stdout.strip().split("\n"):
-                    parts = line.split("\t")
-                    if len(parts) == 3:
-                        added, removed, filepath = parts
-                        changed_files.append(
-                            FileInfo(
-                                path=filepath,
-                                added=0 if added == "-" else int(added),
-                                removed=0 if removed == "-" else int(removed),
-                                status="modified",
-                            )
+        # Get diff stats
+        if numstat.strip():
+            for line in numstat.strip().split("\n"):
+                parts = line.split("\t")
+                if len(parts) == 3:
+                    added, removed, filepath = parts
+                    changed_files.append(
+                        FileInfo(
+                            path=filepath,
+                            added=0 if added == "-" else int(added),
+                            removed=0 if removed == "-" else int(removed),
+                            status="modified",
                         )
-        except Exception:
-            pass
+                    )
 
         # Get untracked files
-        try:
-            result = subprocess.run(
-                [
-                    "git",
-                    "-c",
-                    "core.quotepath=false",
-                    "ls-files",
-                    "--others",
-                    "--exclude-standard",
-                ],
-                cwd=self.project_dir,
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-
-            if result.stdout.strip():
-                for filepath in result.stdout.strip().split("\n"):
-                    try:
-                        content = (self.project_dir / filepath).read_text()
-                        lines = len(content.split("\n"))
-                        changed_files.append(
-                            FileInfo(
-                                path=filepath,
-                                added=lines,
-                                removed=0,
-                                status="added",
-                            )
-                        )
-                    except Exception:
-                        continue
-        except Exception:
-            pass
-
-        # Get deleted files
-        try:
-            result = subprocess.run(
-                [
-                    "git",
-                    "-c",
-                    "core.quotepath=false",
-                    "diff",
-                    "--name-only",
-                    "--diff-filter=D",
-                    "HEAD",
-                ],
-                cwd=self.project_dir,
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-
-            if result.stdout.strip():
-                for filepath in result.stdout.strip().split("\n"):
+        if untracked.strip():
+            for filepath in untracked.strip().split("\n"):
+                try:
+                    data = (self.project_dir / filepath).read_bytes()
+                    lines = data.count(b"\n") + 1
                     changed_files.append(
                         FileInfo(
                             path=filepath,
-                            added=0,
+                            added=lines,
                             removed=0,
-                            status="deleted",
+                            status="added",
                         )
                     )
-        except Exception:
-            pass
+                except Exception:
+                    continue
+
+        # Get deleted files
+        if deleted.strip():
+            for filepath in deleted.strip().split("\n"):
+                changed_files.append(
+                    FileInfo(
+                        path=filepath,
+                        added=0,
+                        removed=0,
+                        status="deleted",
+                    )
+                )
 
         return changed_files
 
@@ -300,7 +365,7 @@ class FileManager:
             # Handle images
             if is_image_by_extension(file_path):
                 if full_path.exists():
-                    content = base64.b64encode(full_path.read_bytes()).decode()
+                    content = _encode_base64(full_path)
                     mime_type = get_image_mime_type(file_path)
                     return FileContent(
                         type="text",
@@ -317,8 +382,7 @@ class FileManager:
             if not full_path.exists():
                 return FileContent(type="text", content="")
 
-            mime_type, _ = mimetypes.guess_type(str(full_path))
-            mime_type = mime_type or "application/octet-stream"
+            mime_type = _MIME_BY_EXT.get(_ext(file_path), "application/octet-stream")
 
             # Check if we should encode
             encode = should_encode(full_path)
@@ -327,7 +391,7 @@ class FileManager:
                 return FileContent(type="binary", content="", mime_type=mime_type)
 
             if encode:
-                content = base64.b64encode(full_path.read_bytes()).decode()
+                content = _encode_base64(full_path)
                 return FileContent(
                     type="text",
                     content=content,
@@ -337,39 +401,27 @@ class FileManager:
 
             content = full_path.read_text().strip()
 
-            # Get diff if in git
+            # Get diff if in git. The changed-path sets tell us up front whether
+            # the file is clean or which single diff (unstaged, else staged) to run.
             if self.vcs == "git":
-                try:
-                    diff_result = subprocess.run(
-                        ["git", "diff", file_path],
-                        cwd=self.project_dir,
-                        capture_output=True,
-                        text=True,
-                        check=False,
-                    )
-                    diff = diff_result.stdout
-
-                    if not diff.strip():
-                        diff_result = subprocess.run(
-                            ["git", "diff", "--staged", file_path],
-                            cwd=self.project_dir,
-                            capture_output=True,
-                            text=True,
-                            check=False,
-                        )
-                        diff = diff_result.stdout
-
-                    if diff.strip():
-                        return FileContent(type="text", content=content, diff=diff)
-                except Exception:
-                    pass
+                unstaged, staged = await self._get_dirty_sets()
+                rel_path = Path(os.path.normpath(file_path)).as_posix()
+                if rel_path in unstaged:
+                    diff = await self._git("diff", "--", file_path)
+                elif rel_path in staged:
+                    diff = await self._git("diff", "--staged", "--", file_path)
+                else:
+                    diff = ""
+
+                if diff.strip():
+                    return FileContent(type="text", content=content, diff=diff)
 
             return FileContent(type="text", content=content)
 
     async def list(self, dir_path: str | None = None) -> List[FileNode]:
         """List files and directories in the given path."""
         exclude = {".git", ".DS_Store"}
-        patterns = self._get_ignore_patterns()
+        is_ignored = self._get_ignore_matcher()
 
         resolved = self.project_dir / (dir_path or "")
 
@@ -389,9 +441,8 @@ class FileManager:
                 full_path = Path(entry.path)
                 relative_path = str(full_path.relative_to(self.project_dir))
                 node_type = "directory" if entry.is_dir() else "file"
-                ignored = self._is_ignored(
-                    relative_path + "/" if node_type == "directory" else relative_path,
-                    patterns,
+                ignored = is_ignored(
+                    relative_path + "/" if node_type == "directory" else relative_path
                 )
 
                 nodes.append(
@@ -410,6 +461,36 @@ class FileManager:
         nodes.sort(key=lambda n: (n.type != "directory", n.name.lower()))
         return nodes
 
+    def _scan(self) -> dict[str, List[str]]:
+        """Scan the project tree for files and directories."""
+        files: List[str] = []
+        directories: List[str] = []
+
+        # Iterative walk; DirEntry.is_dir() reuses the type from readdir
+        stack = [(str(self.project_dir), "")]
+        while stack:
+            dir_path, rel = stack.pop()
+            if rel:
+                directories.append(rel)
+            subdirs = []
+            try:
+                with os.scandir(dir_path) as it:
+                    for entry in it:
+                        name = entry.name
+                        if entry.is_dir(follow_symlinks=False):
+                            # Skip ignored directories
+                            if not name.startswith(".") and name not in exclude:
+                                subdirs.append((entry.path, rel + name + "/"))
+                        elif not name.startswith(".") and not entry.is_dir():
+                            files.append(rel + name)
+            except OSError:
+                continue
+
+            # Reversed so directories are visited in listing order
+            stack.extend(reversed(subdirs))
+
+        return {"files": files, "dirs": directories}
+
     async def search(
         self,
         query: str,
@@ -423,32 +504,13 @@ class FileManager:
 
         log.info("search", {"query": query, "kind": kind})
 
-        # Get cached file list
-        files: List[str] = []
-        directories: List[str] = []
+        # Get cached file list, rescanning once it has gone stale
+        if self._cache is None or time.monotonic() - self._cache_time > _SEARCH_CACHE_TTL:
+            self._cache = await asyncio.to_thread(self._scan)
+            self._cache_time = time.monotonic()
 
-        if self._cache is not None:
-            files = self._cache.get("files", [])
-            directories = self._cache.get("dirs", [])
-
-        # Scan if no cache
-        if not files and not directories:
-            for root, dirs_list, files_list in os.walk(self.project_dir):
-                # Skip ignored directories
-                dirs_list[:] = [
-                    d for d in dirs_list if not d.startswith(".") and d not in exclude
-                ]
-
-                rel_root = str(Path(root).relative_to(self.project_dir))
-                if rel_root != ".":
-                    directories.append(rel_root + "/")
-
-                for file in files_list:
-                    if not file.startswith("."):
-                        if rel_root == ".":
-                            files.append(file)
-                        else:
-                            files.append(f"{rel_root}/{file}")
+        files = self._cache["files"]
+        directories = self._cache["dirs"]
 
         if not query:
             if kind == "file":
@@ -456,13 +518,12 @@ class FileManager:
             return directories[:limit]
 
         # Fuzzy search
-        from fuzzywuzzy import fuzz
+        from rapidfuzz import fuzz, process
 
         items = files if kind == "file" else directories if kind == "directory" else files + directories
-        scored = [(item, fuzz.partial_ratio(query, item)) for item in items]
-        scored.sort(key=lambda x: x[1], reverse=True)
+        results = process.extract(query, items, scorer=fuzz.partial_ratio, limit=limit)
 
-        return [item for item, _ in scored[:limit]]
+        return [item for item, _, _ in results]
 
 
 # Exclude patterns for scanning
@@ -1,73 +1,104 @@
 """Code formatting module."""
 
 import asyncio
+import hashlib
 import shutil
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel, Field
-
 from opencode.util import create as create_logger
 
 log = create_logger({"service": "format"})
 
+# Number of successful format results kept for unchanged input
+_FORMAT_CACHE_SIZE = 256
+
 
-class FormatterConfig(BaseModel):
+@dataclass(slots=True)
+class FormatterConfig:
     """Formatter configuration."""
     
-    name: str = Field(description="Formatter name")
-    command: list[str] = Field(description="Formatter command and arguments")
-    extensions: list[str] = Field(description="Supported file extensions")
-    install_cmd: str | None = Field(default=None, description="Command to install formatter")
+    name: str
+    # Formatter command and arguments; "{file}" is replaced by the file path
+    command: list[str]
+    # Supported file extensions, with the leading dot
+    extensions: list[str]
+    # Command to install the formatter
+    install_cmd: str | None = None
+    # Whether any command argument contains "{file}"
+    has_file_placeholder: bool = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        self.has_file_placeholder = any("{file}" in arg for arg in self.command)
 
 
-class FormatResult(BaseModel):
+@dataclass(slots=True, frozen=True)
+class FormatResult:
     """Result of formatting operation."""
     
-    success: bool = Field(description="Whether formatting succeeded")
-    formatted: bool = Field(description="Whether file was changed")
-    output: str = Field(default="", description="Formatter output")
-    error: str | None = Field(default=None, description="Error message if failed")
+    success: bool
+    # Whether the formatter changed the code
+    formatted: bool
+    output: str = ""
+    error: str | None = None
+
+
+# Built-in formatters, materialized when a FormatManager is first used
+_DEFAULT_FORMATTERS: tuple[dict[str, Any], ...] = (
+    {
+        "name": "black",
+        "command": ["black", "-"],
+        "extensions": [".py"],
+        "install_cmd": "pip install black",
+    },
+    {
+        "name": "prettier",
+        "command": ["prettier", "--stdin-filepath", "{file}"],
+        "extensions": [".js", ".ts", ".jsx", ".tsx", ".json", ".md", ".css", ".html"],
+        "install_cmd": "npm install -g prettier",
+    },
+    {
+        "name": "rustfmt",
+        "command": ["rustfmt", "--emit", "stdout"],
+        "extensions": [".rs"],
+    },
+    {
+        "name": "gofmt",
+        "command": ["gofmt"],
+        "extensions": [".go"],
+    },
+)
 
 
 class FormatManager:
     """Manages code formatters."""
     
     def __init__(self) -> None:
-        self._formatters: dict[str, FormatterConfig] = {}
-        self._init_default_formatters()
+        # Filled with _DEFAULT_FORMATTERS on first use
+        self._registry: dict[str, FormatterConfig] | None = None
+        # Extension -> first registered formatter handling it, built on demand
+        self._by_ext: dict[str, FormatterConfig] | None = None
+        # Formatter command -> resolved executable; only hits are kept so a
+        # formatter installed later is still found
+        self._executables: dict[str, str] = {}
+        # (command, input digest) -> result, least recently used first
+        self._format_cache: OrderedDict[tuple[tuple[str, ...], bytes], FormatResult] = OrderedDict()
     
-    def _init_default_formatters(self) -> None:
-        """Initialize default formatters."""
-        self.register(FormatterConfig(
-            name="black",
-            command=["black", "-"],
-            extensions=[".py"],
-            install_cmd="pip install black",
-        ))
-        
-        self.register(FormatterConfig(
-            name="prettier",
-            command=["prettier", "--stdin-filepath", "{file}"],
-            extensions=[".js", ".ts", ".jsx", ".tsx", ".json", ".md", ".css", ".html"],
-            install_cmd="npm install -g prettier",
-        ))
-        
-        self.register(FormatterConfig(
-            name="rustfmt",
-            command=["rustfmt", "--emit", "stdout"],
-            extensions=[".rs"],
-        ))
-        
-        self.register(FormatterConfig(
-            name="gofmt",
-            command=["gofmt"],
-            extensions=[".go"],
-        ))
+    @property
+    def _formatters(self) -> dict[str, FormatterConfig]:
+        """Registered formatters, starting with the defaults."""
+        if self._registry is None:
+            self._registry = {
+                config["name"]: FormatterConfig(**config) for config in _DEFAULT_FORMATTERS
+            }
+        return self._registry
     
     def register(self, formatter: FormatterConfig) -> None:
         """Register a formatter."""
         self._formatters[formatter.name] = formatter
+        self._by_ext = None
     
     def get(self, name: str) -> FormatterConfig | None:
         """Get a formatter by name."""
@@ -75,13 +106,12 @@ class FormatManager:
     
     def get_for_file(self, file_path: str | Path) -> FormatterConfig | None:
         """Get appropriate formatter for a file."""
-        path = Path(file_path)
-        ext = path.suffix.lower()
-        
-        for formatter in self._formatters.values():
-            if ext in formatter.extensions:
-                return formatter
-        return None
+        if self._by_ext is None:
+            self._by_ext = {}
+            for formatter in self._formatters.values():
+                for ext in formatter.extensions:
+                    self._by_ext.setdefault(ext, formatter)
+        return self._by_ext.get(Path(file_path).suffix.lower())
     
     def list_formatters(self) -> list[FormatterConfig]:
         """List all registered formatters."""
@@ -115,30 +145,42 @@ class FormatManager:
         
         # Check if formatter is available
         cmd = formatter.command[0]
-        if not shutil.which(cmd):
+        executable = self._executables.get(cmd) or shutil.which(cmd)
+        if not executable:
             return FormatResult(
                 success=False,
                 formatted=False,
                 error=f"Formatter '{cmd}' not found. Install with: {formatter.install_cmd}",
             )
         
+        self._executables[cmd] = executable
+        
         try:
             # Prepare command
-            command = formatter.command.copy()
-            if file_path:
+            command = formatter.command
+            if file_path and formatter.has_file_placeholder:
                 command = [c.replace("{file}", file_path) for c in command]
             
+            # Same command on the same input gives the same output
+            code_bytes = code.encode()
+            key = (tuple(command), hashlib.blake2b(code_bytes, digest_size=16).digest())
+            cached = self._format_cache.get(key)
+            if cached is not None:
+                self._format_cache.move_to_end(key)
+                return cached
+            
             log.info("Formatting", {"formatter": formatter.name})
             
-            # Run formatter
+            # Run formatter by absolute path, skipping the PATH search in exec
             proc = await asyncio.create_subprocess_exec(
-                *command,
+                executable,
+                *command[1:],
                 stdin=asyncio.subprocess.PIPE,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
             )
             
-            stdout, stderr = await proc.communicate(code.encode())
+            stdout, stderr = await proc.communicate(code_bytes)
             
             if proc.returncode != 0:
                 return FormatResult(
@@ -147,15 +189,21 @@ class FormatManager:
                     error=stderr.decode(),
                 )
             
-            formatted_code = stdout.decode()
-            
-            return FormatResult(
+            # Compare as bytes; only decode once for the result
+            result = FormatResult(
                 success=True,
-                formatted=formatted_code != code,
-                output=formatted_code,
+                formatted=stdout != code_bytes,
+                output=stdout.decode(),
             )
+            self._format_cache[key] = result
+            if len(self._format_cache) > _FORMAT_CACHE_SIZE:
+                self._format_cache.popitem(last=False)
+            return result
             
         except Exception as e:
+            if isinstance(e, FileNotFoundError):
+                # The cached executable went away; look it up again next time
+                self._executables.pop(cmd, None)
             return FormatResult(
                 success=False,
                 formatted=False,
@@ -1,10 +1,13 @@
 """Global paths and configuration."""
 
 import os
+import shutil
+import threading
 from pathlib import Path
 
 APP_NAME = "opencode"
 CACHE_VERSION = "21"
+_CACHE_DIR = f"v{CACHE_VERSION}"
 
 
 def get_home() -> str:
@@ -18,66 +21,63 @@ class GlobalPaths:
     def __init__(self) -> None:
         self._init_xdg_paths()
         self._ensure_directories()
-        self._check_cache_version()
+        self._remove_stale_caches()
 
     def _init_xdg_paths(self) -> None:
         """Initialize XDG paths."""
+        # Built as strings and wrapped in a Path once per directory
+        home = get_home()
+        environ = os.environ
+
         # XDG Data
-        xdg_data = os.environ.get("XDG_DATA_HOME") or Path.home() / ".local" / "share"
-        self.data = Path(xdg_data) / APP_NAME
+        xdg_data = environ.get("XDG_DATA_HOME") or os.path.join(home, ".local", "share")
+        self.data = Path(xdg_data, APP_NAME)
 
-        # XDG Cache
-        xdg_cache = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
-        self.cache = Path(xdg_cache) / APP_NAME
+        # XDG Cache, namespaced by CACHE_VERSION so a bump starts from an empty cache
+        xdg_cache = environ.get("XDG_CACHE_HOME") or os.path.join(home, ".cache")
+        self.cache = Path(xdg_cache, APP_NAME, _CACHE_DIR)
 
         # XDG Config
-        xdg_config = os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config"
-        self.config = Path(xdg_config) / APP_NAME
+        xdg_config = environ.get("XDG_CONFIG_HOME") or os.path.join(home, ".config")
+        self.config = Path(xdg_config, APP_NAME)
 
         # XDG State
-        xdg_state = os.environ.get("XDG_STATE_HOME") or Path.home() / ".local" / "state"
-        self.state = Path(xdg_state) / APP_NAME
+        xdg_state = environ.get("XDG_STATE_HOME") or os.path.join(home, ".local", "state")
+        self.state = Path(xdg_state, APP_NAME)
 
         # Derived paths
-        self.bin = self.data / "bin"
-        self.log = self.data / "log"
+        self.bin = Path(xdg_data, APP_NAME, "bin")
+        self.log = Path(xdg_data, APP_NAME, "log")
 
     def _ensure_directories(self) -> None:
         """Ensure all required directories exist."""
-        self.data.mkdir(parents=True, exist_ok=True)
-        self.config.mkdir(parents=True, exist_ok=True)
-        self.state.mkdir(parents=True, exist_ok=True)
-        self.log.mkdir(parents=True, exist_ok=True)
-        self.bin.mkdir(parents=True, exist_ok=True)
-        self.cache.mkdir(parents=True, exist_ok=True)
-
-    def _check_cache_version(self) -> None:
-        """Check and clear cache if version mismatch."""
-        version_file = self.cache / "version"
-        current_version = "0"
-
-        if version_file.exists():
-            try:
-                current_version = version_file.read_text().strip()
-            except Exception:
-                pass
-
-        if current_version != CACHE_VERSION:
-            # Clear cache
-            if self.cache.exists():
-                for item in self.cache.iterdir():
-                    try:
-                        if item.is_dir():
-                            import shutil
-
-                            shutil.rmtree(item)
-                        else:
-                            item.unlink()
-                    except Exception:
-                        pass
-
-            # Write new version
-            version_file.write_text(CACHE_VERSION)
+        # Only leaf directories: data is created as the parent of bin and log
+        for path in (self.bin, self.log, self.config, self.state, self.cache):
+            os.makedirs(path, exist_ok=True)
+
+    def _remove_stale_caches(self) -> None:
+        """Delete caches from other versions in the background."""
+        try:
+            with os.scandir(self.cache.parent) as it:
+                stale = [entry.path for entry in it if entry.name != self.cache.name]
+        except OSError:
+            return
+
+        if stale:
+            # Daemon thread so a large old cache never delays startup or exit
+            threading.Thread(target=_remove_paths, args=(stale,), daemon=True).start()
+
+
+def _remove_paths(paths: list[str]) -> None:
+    """Remove files and directory trees, ignoring errors."""
+    for path in paths:
+        try:
+            if os.path.isdir(path) and not os.path.islink(path):
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                os.unlink(path)
+        except OSError:
+            pass
 
 
 # Global instance
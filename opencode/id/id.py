@@ -1,6 +1,8 @@
 """ID generation utilities."""
 
+import functools
 import os
+import threading
 import time
 from typing import Literal
 
@@ -19,6 +21,20 @@ prefixes = {
 
 LENGTH = 26
 
+# Maps each random byte to a base62 character (byte % 62), for bytes.translate
+_BASE62_TABLE = bytes(
+    ord("0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"[b % 62])
+    for b in range(256)
+)
+
+# Random bytes are drawn from a buffer refilled in blocks, so most IDs need no
+# urandom syscall. Cleared in forked children so they never reuse the parent's.
+_ENTROPY_BLOCK = 4096
+_entropy = bytearray()
+_entropy_lock = threading.Lock()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_entropy.clear)
+
 # State for monotonic ID generation
 _last_timestamp = 0
 _counter = 0
@@ -26,12 +42,12 @@ _counter = 0
 
 def _random_base62(length: int) -> str:
     """Generate random base62 string of given length."""
-    chars = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
-    result = ""
-    bytes_data = os.urandom(length)
-    for i in range(length):
-        result += chars[bytes_data[i] % 62]
-    return result
+    with _entropy_lock:
+        if len(_entropy) < length:
+            _entropy.extend(os.urandom(max(length, _ENTROPY_BLOCK)))
+        data = _entropy[:length]
+        del _entropy[:length]
+    return data.translate(_BASE62_TABLE).decode("ascii")
 
 
 def create(prefix: Prefix, descending: bool, timestamp: int | None = None) -> str:
@@ -50,12 +66,10 @@ def create(prefix: Prefix, descending: bool, timestamp: int | None = None) -> st
     if descending:
         now = ~now
 
-    # Convert to 6 bytes
-    time_bytes = bytearray(6)
-    for i in range(6):
-        time_bytes[i] = (now >> (40 - 8 * i)) & 0xFF
+    # Low 6 bytes, big-endian
+    time_hex = (now & 0xFFFFFFFFFFFF).to_bytes(6, "big").hex()
 
-    return f"{prefixes[prefix]}_{time_bytes.hex()}{_random_base62(LENGTH - 12)}"
+    return f"{prefixes[prefix]}_{time_hex}{_random_base62(LENGTH - 12)}"
 
 
 def ascending(prefix: Prefix, given: str | None = None) -> str:
@@ -83,9 +97,9 @@ def schema(prefix: Prefix) -> str:
     return prefixes[prefix]
 
 
+@functools.lru_cache(maxsize=4096)
 def timestamp(id: str) -> int:
     """Extract timestamp from an ascending ID. Does not work with descending IDs."""
-    prefix = id.split("_")[0]
-    hex_part = id[len(prefix) + 1 : len(prefix) + 13]
-    encoded = int(hex_part, 16)
+    start = id.index("_") + 1
+    encoded = int(id[start : start + 12], 16)
     return encoded // 0x1000
@@ -1,16 +1,24 @@
 """IDE integration module."""
 
+import asyncio
+import os
+import shutil
 import subprocess
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel, Field
-
 from opencode.util import create as create_logger
 
 log = create_logger({"service": "ide"})
 
+# How long PATH lookups for IDE commands are reused
+_WHICH_CACHE_TTL = 60.0
+
 
 class IDEType(str, Enum):
     """Supported IDE types."""
@@ -25,54 +33,78 @@ class IDEType(str, Enum):
     VIM = "vim"
 
 
-class IDEConfig(BaseModel):
+@dataclass(slots=True)
+class IDEConfig:
     """IDE configuration."""
     
-    name: str = Field(description="IDE name")
-    type: IDEType = Field(description="IDE type")
-    command: str = Field(description="Command to launch IDE")
-    supports_diff: bool = Field(default=True, description="Whether IDE supports showing diffs")
-    supports_protocol: bool = Field(default=False, description="Whether IDE supports custom protocol")
+    name: str
+    type: IDEType
+    # Command to launch the IDE
+    command: str
+    supports_diff: bool = True
+    # Whether the IDE supports a custom URL protocol
+    supports_protocol: bool = False
+    
+    def __post_init__(self) -> None:
+        # Accept plain strings like "vscode", as the Pydantic model did
+        self.type = IDEType(self.type)
+
+
+def _write_temp_file(content: str, suffix: str) -> str:
+    """Write content to a new temp file and return its path."""
+    with tempfile.NamedTemporaryFile(mode="w", suffix=suffix, delete=False) as f:
+        f.write(content)
+        return f.name
+
+
+# Built-in IDEs, materialized when an IDEManager is first used
+_DEFAULT_IDES: tuple[dict[str, Any], ...] = (
+    {
+        "name": "VS Code",
+        "type": IDEType.VSCODE,
+        "command": "code",
+        "supports_diff": True,
+        "supports_protocol": True,
+    },
+    {
+        "name": "Cursor",
+        "type": IDEType.CURSOR,
+        "command": "cursor",
+        "supports_diff": True,
+        "supports_protocol": True,
+    },
+    {
+        "name": "Zed",
+        "type": IDEType.ZED,
+        "command": "zed",
+        "supports_diff": True,
+    },
+    {
+        "name": "Neovim",
+        "type": IDEType.NEOVIM,
+        "command": "nvim",
+        "supports_diff": False,
+    },
+)
 
 
 class IDEManager:
     """Manages IDE integrations."""
     
     def __init__(self) -> None:
-        self._ides: dict[IDEType, IDEConfig] = {}
-        self._init_default_ides()
+        # Filled with _DEFAULT_IDES on first use
+        self._registry: dict[IDEType, IDEConfig] | None = None
+        self._which_cache: dict[str, str | None] = {}
+        self._which_cache_time = 0.0
     
-    def _init_default_ides(self) -> None:
-        """Initialize default IDE configurations."""
-        self.register(IDEConfig(
-            name="VS Code",
-            type=IDEType.VSCODE,
-            command="code",
-            supports_diff=True,
-            supports_protocol=True,
-        ))
-        
-        self.register(IDEConfig(
-            name="Cursor",
-            type=IDEType.CURSOR,
-            command="cursor",
-            supports_diff=True,
-            supports_protocol=True,
-        ))
-        
-        self.register(IDEConfig(
-            name="Zed",
-            type=IDEType.ZED,
-            command="zed",
-            supports_diff=True,
-        ))
-        
-        self.register(IDEConfig(
-            name="Neovim",
-            type=IDEType.NEOVIM,
-            command="nvim",
-            supports_diff=False,
-        ))
+    @property
+    def _ides(self) -> dict[IDEType, IDEConfig]:
+        """Registered IDEs, starting with the defaults."""
+        if self._registry is None:
+            self._registry = {
+                config["type"]: IDEConfig(**config) for config in _DEFAULT_IDES
+            }
+        return self._registry
     
     def register(self, config: IDEConfig) -> None:
         """Register an IDE."""
@@ -82,16 +114,49 @@ class IDEManager:
         """Get IDE configuration."""
         return self._ides.get(ide_type)
     
-    def detect_installed_ides(self) -> list[IDEType]:
-        """Detect which IDEs are installed."""
-        import shutil
+    def _which(self, command: str) -> str | None:
+        """Resolve a command on PATH, reusing recent lookups."""
+        now = time.monotonic()
+        if now - self._which_cache_time > _WHICH_CACHE_TTL:
+            self._which_cache.clear()
+            self._which_cache_time = now
         
-        installed = []
-        for ide_type, config in self._ides.items():
-            if shutil.which(config.command):
-                installed.append(ide_type)
+        try:
+            return self._which_cache[command]
+        except KeyError:
+            resolved = self._which_cache[command] = shutil.which(command)
+            return resolved
+    
+    def _launch(self, cmd: list[str]) -> None:
+        """Start an IDE process in the background, discarding its output."""
+        executable = self._which(cmd[0])
+        if executable is None:
+            raise FileNotFoundError(f"Command not found: {cmd[0]}")
+        
+        if not hasattr(os, "posix_spawn"):
+            subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            return
         
-        return installed
+        # posix_spawn avoids forking a copy of this interpreter just to exec
+        pid = os.posix_spawn(
+            executable,
+            cmd,
+            os.environ,
+            file_actions=[
+                (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+                (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+            ],
+        )
+        # Reap the child when it exits so it doesn't linger as a zombie
+        threading.Thread(target=os.waitpid, args=(pid, 0), daemon=True).start()
+    
+    def detect_installed_ides(self) -> list[IDEType]:
+        """Detect which IDEs are installed."""
+        return [
+            ide_type
+            for ide_type, config in self._ides.items()
+            if self._which(config.command)
+        ]
     
     def open_file(
         self,
@@ -136,14 +201,14 @@ class IDEManager:
             cmd.append(str(path))
         
         try:
-            subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            self._launch(cmd)
             log.info("Opened file in IDE", {"path": str(path), "ide": config.name})
             return True
         except Exception as e:
             log.error("Failed to open IDE", {"error": str(e)})
             return False
     
-    def open_diff(
+    async def open_diff(
         self,
         file_path: str | Path,
         original_content: str,
@@ -165,22 +230,17 @@ class IDEManager:
             log.error("IDE does not support diff view")
             return False
         
-        # Create temp files for diff
-        import tempfile
-        
-        with tempfile.NamedTemporaryFile(mode="w", suffix=path.suffix, delete=False) as f:
-            f.write(original_content)
-            original_file = f.name
-        
-        with tempfile.NamedTemporaryFile(mode="w", suffix=path.suffix, delete=False) as f:
-            f.write(modified_content)
-            modified_file = f.name
+        # Create temp files for diff, writing both concurrently off the event loop
+        original_file, modified_file = await asyncio.gather(
+            asyncio.to_thread(_write_temp_file, original_content, path.suffix),
+            asyncio.to_thread(_write_temp_file, modified_content, path.suffix),
+        )
         
         try:
             # Open diff in IDE
             if ide_type in (IDEType.VSCODE, IDEType.CURSOR):
                 cmd = [config.command, "--diff", original_file, modified_file]
-                subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                self._launch(cmd)
                 return True
             else:
                 # Fallback: just open the modified file
@@ -190,7 +250,6 @@ class IDEManager:
             return False
         finally:
             # Clean up temp files
-            import os
             try:
                 os.unlink(original_file)
                 os.unlink(modified_file)
@@ -216,11 +275,7 @@ class IDEManager:
             return False
         
         try:
-            subprocess.Popen(
-                [config.command, str(path)],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            )
+            self._launch([config.command, str(path)])
             return True
         except Exception as e:
             log.error("Failed to open workspace", {"error": str(e)})
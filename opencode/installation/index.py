@@ -2,16 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 import subprocess
+import time
 from pathlib import Path
 from typing import Any
 
+import httpx
 from pydantic import BaseModel, Field
 
 from opencode.bus import bus_event
+from opencode.config.util import json_loads
 from opencode.flag import index as flag
 from opencode.util import log
+from opencode.util.http import create_http_client
 
 logger = log.create(service="installation")
 
@@ -19,6 +24,13 @@ VERSION = "0.0.1"
 CHANNEL = "local"
 USER_AGENT = f"opencode/{CHANNEL}/{VERSION}/{flag.OPENCODE_CLIENT}"
 
+# How long a fetched latest version is reused, per install method
+_LATEST_TTL = 300.0
+_latest_cache: dict[str, tuple[float, str]] = {}
+
+# Shared client for version lookups, created on first use
+_http_client: httpx.AsyncClient | None = None
+
 
 class InstallationInfo(BaseModel):
     """Installation information."""
@@ -92,29 +104,51 @@ async def method() -> str:
     # Sort by likelihood based on exec path
     checks.sort(key=lambda x: exec_lower.count(x[0]), reverse=True)
     
-    for name, cmd in checks:
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            
-            installed_name = "opencode"
-            if name in ("brew", "choco", "scoop"):
-                installed_name = "opencode"
-            else:
-                installed_name = "opencode-ai"
-            
-            if installed_name in result.stdout.lower():
+    # Run every probe concurrently, but take results in likelihood order so
+    # the answer is the same as probing one at a time
+    tasks = [asyncio.ensure_future(_probe(name, cmd)) for name, cmd in checks]
+    try:
+        for (name, _), task in zip(checks, tasks, strict=True):
+            if await task:
                 return name
-        except (subprocess.TimeoutExpired, FileNotFoundError, Exception):
-            continue
+    finally:
+        for task in tasks:
+            task.cancel()
     
     return "unknown"
 
 
+async def _probe(name: str, cmd: list[str]) -> bool:
+    """Check whether a package manager lists opencode as installed."""
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+    except Exception:
+        return False
+    
+    try:
+        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=10)
+    except BaseException as e:
+        # Timed out, or cancelled because a likelier probe already matched
+        try:
+            proc.kill()
+        except ProcessLookupError:
+            pass
+        if isinstance(e, asyncio.CancelledError):
+            raise
+        return False
+    
+    if name in ("brew", "choco", "scoop"):
+        installed_name = "opencode"
+    else:
+        installed_name = "opencode-ai"
+    
+    return installed_name in stdout.decode(errors="replace").lower()
+
+
 async def _get_brew_formula() -> str:
     """Get the brew formula name."""
     try:
@@ -193,73 +227,82 @@ async def upgrade(method_name: str, target: str) -> None:
     )
 
 
+def _get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client for version lookups."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = create_http_client(
+            timeout=10.0,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=10),
+        )
+    return _http_client
+
+
+async def _fetch_json(url: str, headers: dict[str, str] | None = None) -> Any:
+    """Fetch and parse a JSON document."""
+    response = await _get_http_client().get(url, headers=headers)
+    response.raise_for_status()
+    return json_loads(response.content)
+
+
 async def latest(install_method: str | None = None) -> str:
     """Get the latest version."""
     detected_method = install_method or await method()
     
+    cached = _latest_cache.get(detected_method)
+    if cached is not None and time.monotonic() - cached[0] < _LATEST_TTL:
+        return cached[1]
+    
+    version = await _fetch_latest(detected_method)
+    if version is None:
+        return VERSION
+    
+    _latest_cache[detected_method] = (time.monotonic(), version)
+    return version
+
+
+async def _fetch_latest(detected_method: str) -> str | None:
+    """Look up the latest version for an install method, or None on failure."""
     if detected_method == "brew":
         try:
-            import urllib.request
-            import json
-            
-            url = "https://formulae.brew.sh/api/formula/opencode.json"
-            with urllib.request.urlopen(url, timeout=10) as response:
-                data = json.loads(response.read())
-                return data["versions"]["stable"]
+            data = await _fetch_json("https://formulae.brew.sh/api/formula/opencode.json")
+            return data["versions"]["stable"]
         except Exception:
             pass
     
     if detected_method in ("npm", "pnpm", "pip"):
         try:
-            import urllib.request
-            import json
-            
-            registry = "https://pypi.org/pypi/opencode-ai/json"
-            with urllib.request.urlopen(registry, timeout=10) as response:
-                data = json.loads(response.read())
-                return data["info"]["version"]
+            data = await _fetch_json("https://pypi.org/pypi/opencode-ai/json")
+            return data["info"]["version"]
         except Exception:
             pass
     
     if detected_method == "choco":
         try:
-            import urllib.request
-            import json
-            
             url = "https://community.chocolatey.org/api/v2/Packages?$filter=Id%20eq%20%27opencode%27%20and%20IsLatestVersion&$select=Version"
             headers = {"Accept": "application/json;odata=verbose"}
-            req = urllib.request.Request(url, headers=headers)
-            with urllib.request.urlopen(req, timeout=10) as response:
-                data = json.loads(response.read())
-                return data["d"]["results"][0]["Version"]
+            data = await _fetch_json(url, headers)
+            return data["d"]["results"][0]["Version"]
         except Exception:
             pass
     
     if detected_method == "scoop":
         try:
-            import urllib.request
-            import json
-            
-            url = "https://raw.githubusercontent.com/ScoopInstaller/Main/master/bucket/opencode.json"
-            with urllib.request.urlopen(url, timeout=10) as response:
-                data = json.loads(response.read())
-                return data["version"]
+            data = await _fetch_json(
+                "https://raw.githubusercontent.com/ScoopInstaller/Main/master/bucket/opencode.json"
+            )
+            return data["version"]
         except Exception:
             pass
     
     # Default to GitHub releases
     try:
-        import urllib.request
-        import json
-        
         url = "https://api.github.com/repos/anomalyco/opencode/releases/latest"
-        headers = {"User-Agent": USER_AGENT}
-        req = urllib.request.Request(url, headers=headers)
-        with urllib.request.urlopen(req, timeout=10) as response:
-            data = json.loads(response.read())
-            return data["tag_name"].replace("v", "")
+        data = await _fetch_json(url, {"User-Agent": USER_AGENT})
+        return data["tag_name"].replace("v", "")
     except Exception:
-        return VERSION
+        return None
 
 
 __all__ = [
@@ -6,6 +6,7 @@ from typing import Any
 from pydantic import BaseModel, Field
 
 from opencode.bus import bus_event
+from opencode.lsp.server import Gopls, Pyright, RustAnalyzer, Typescript, _clear_root_cache
 from opencode.project import instance
 from opencode.util import log
 
@@ -93,11 +94,18 @@ USFUL_KINDS = [
 _servers: dict[str, Any] = {}
 _clients: list[Any] = []
 
+# Extensions handled by the built-in servers
+_SUPPORTED_EXTS = frozenset(
+    ext for server in (Typescript, Pyright, Gopls, RustAnalyzer) for ext in server.extensions
+)
+
 
 async def init() -> None:
     """Initialize LSP subsystem."""
     # Initialize LSP servers from config
     logger.info("initializing LSP")
+    # Roots resolved for a previous workspace or config no longer apply
+    _clear_root_cache()
 
 
 async def status() -> list[Status]:
@@ -115,10 +123,10 @@ async def status() -> list[Status]:
 
 async def has_clients(file: str) -> bool:
     """Check if there are clients for a file."""
-    ext = Path(file).suffix or file
+    dot = file.rfind(".")
+    ext = file[dot:] if dot >= 0 else file
     # Check if any server handles this extension
-    # This is a simplified check
-    return ext in [".ts", ".tsx", ".js", ".jsx", ".py", ".go", ".rs"]
+    return ext in _SUPPORTED_EXTS
 
 
 async def touch_file(file: str, wait_for_diagnostics: bool = False) -> None:
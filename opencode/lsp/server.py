@@ -1,5 +1,9 @@
 """LSP server definitions for opencode."""
 
+import asyncio
+import os
+import shutil
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Callable, Coroutine
 
@@ -21,37 +25,69 @@ class Handle(BaseModel):
 
 RootFunction = Callable[[str], Coroutine[Any, Any, str | None]]
 
+# Resolved roots keyed by (start dir, stop dir, includes, excludes), least recently used first
+_ROOT_CACHE_SIZE = 1024
+_root_cache: OrderedDict[tuple[str, str, tuple[str, ...], tuple[str, ...]], str | None] = OrderedDict()
+
+
+def _clear_root_cache() -> None:
+    """Forget all resolved roots."""
+    _root_cache.clear()
+
+
+async def _first_match(pattern: str, start: Path, stop: str) -> str | None:
+    """Return the nearest match for a pattern walking up from start."""
+    matches = filesystem.up({
+        "targets": [pattern],
+        "start": start,
+        "stop": stop,
+    })
+    async for match in matches:
+        if match:
+            return match
+    return None
+
 
 def nearest_root(
     include_patterns: list[str],
     exclude_patterns: list[str] | None = None,
 ) -> RootFunction:
     """Create a root function that finds nearest matching directory."""
+    excludes = list(exclude_patterns or [])
+    patterns_key = (tuple(include_patterns), tuple(excludes))
+    
     async def root(file: str) -> str | None:
-        if exclude_patterns:
-            # Check for excluded patterns
-            for pattern in exclude_patterns:
-                matches = filesystem.up({
-                    "targets": [pattern],
-                    "start": Path(file).parent,
-                    "stop": instance.get_directory(),
-                })
-                async for match in matches:
-                    if match:
-                        return None
+        start = Path(file).parent
+        stop = instance.get_directory()
+        
+        # Files in the same directory share a root
+        key = (str(start), str(stop), *patterns_key)
+        if key in _root_cache:
+            _root_cache.move_to_end(key)
+            return _root_cache[key]
+        
+        result = await find(start, stop)
+        _root_cache[key] = result
+        if len(_root_cache) > _ROOT_CACHE_SIZE:
+            _root_cache.popitem(last=False)
+        return result
+    
+    async def find(start: Path, stop: str) -> str | None:
+        # Walk every pattern concurrently; the results keep pattern order
+        results = await asyncio.gather(
+            *(_first_match(pattern, start, stop) for pattern in excludes + include_patterns)
+        )
         
-        # Find included patterns
-        for pattern in include_patterns:
-            matches = filesystem.up({
-                "targets": [pattern],
-                "start": Path(file).parent,
-                "stop": instance.get_directory(),
-            })
-            async for match in matches:
-                if match:
-                    return str(Path(match).parent)
+        # Check for excluded patterns
+        if any(results[:len(excludes)]):
+            return None
         
-        return instance.get_directory()
+        # First included pattern in priority order wins
+        for match in results[len(excludes):]:
+            if match:
+                return str(Path(match).parent)
+        
+        return stop
     
     return root
 
@@ -108,16 +144,29 @@ RustAnalyzer = ServerInfo(
 )
 
 
+# (executable, PATH) -> resolved path; only hits are kept so a server
+# installed later is still found
+_executables: dict[tuple[str, str], str] = {}
+
+
+def _which(name: str) -> str | None:
+    """Resolve an executable, memoized on the current PATH."""
+    key = (name, os.environ.get("PATH", os.defpath))
+    executable = _executables.get(key)
+    if executable is None:
+        executable = shutil.which(name, path=key[1])
+        if executable:
+            _executables[key] = executable
+    return executable
+
+
 async def _spawn_typescript(root: str) -> Handle | None:
     """Spawn TypeScript language server."""
-    import shutil
-    
-    tsserver = shutil.which("typescript-language-server")
+    tsserver = _which("typescript-language-server")
     if not tsserver:
         logger.info("typescript-language-server not found")
         return None
     
-    import asyncio
     process = await asyncio.create_subprocess_exec(
         tsserver,
         "--stdio",
@@ -129,14 +178,11 @@ async def _spawn_typescript(root: str) -> Handle | None:
 
 async def _spawn_pyright(root: str) -> Handle | None:
     """Spawn Pyright language server."""
-    import shutil
-    
-    pyright = shutil.which("pyright-langserver")
+    pyright = _which("pyright-langserver")
     if not pyright:
         logger.info("pyright-langserver not found")
         return None
     
-    import asyncio
     process = await asyncio.create_subprocess_exec(
         pyright,
         "--stdio",
@@ -148,14 +194,11 @@ async def _spawn_pyright(root: str) -> Handle | None:
 
 async def _spawn_gopls(root: str) -> Handle | None:
     """Spawn Go language server."""
-    import shutil
-    
-    gopls = shutil.which("gopls")
+    gopls = _which("gopls")
     if not gopls:
         logger.info("gopls not found")
         return None
     
-    import asyncio
     process = await asyncio.create_subprocess_exec(
         gopls,
         cwd=root,
@@ -166,14 +209,11 @@ async def _spawn_gopls(root: str) -> Handle | None:
 
 async def _spawn_rust_analyzer(root: str) -> Handle | None:
     """Spawn Rust analyzer."""
-    import shutil
-    
-    rust_analyzer = shutil.which("rust-analyzer")
+    rust_analyzer = _which("rust-analyzer")
     if not rust_analyzer:
         logger.info("rust-analyzer not found")
         return None
     
-    import asyncio
     process = await asyncio.create_subprocess_exec(
         rust_analyzer,
         cwd=root,
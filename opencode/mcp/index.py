@@ -1,5 +1,8 @@
 """MCP (Model Context Protocol) client for opencode."""
 
+import asyncio
+import time
+from collections import OrderedDict
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -45,6 +48,27 @@ class McpServer(BaseModel):
 
 _servers: dict[str, McpServer] = {}
 
+# Connected servers by name with their last use (monotonic), least recently used first
+_MAX_ACTIVE = 8
+_IDLE_TIMEOUT = 60.0
+_active: OrderedDict[str, float] = OrderedDict()
+_sweeper: asyncio.Task[None] | None = None
+
+
+# Default per-server startup timeout in ms
+_DEFAULT_TIMEOUT = 5000
+
+
+def _register(name: str, server_config: dict[str, Any]) -> None:
+    """Register an MCP server from its config; it connects on first use."""
+    server_type = server_config.get("type", "local")
+    if server_type == "local":
+        config_obj = McpLocal(**server_config)
+    else:
+        config_obj = McpRemote(**server_config)
+    
+    _servers[name] = McpServer(name=name, config=config_obj)
+
 
 async def init() -> None:
     """Initialize MCP subsystem."""
@@ -54,18 +78,14 @@ async def init() -> None:
     from opencode.config import index as config
     cfg = await config.get()
     
+    # Only register here; call() connects each server on demand, so startup
+    # never waits on a server and never connects more than _MAX_ACTIVE
     for name, server_config in (cfg.mcp or {}).items():
-        if isinstance(server_config, dict):
-            if server_config.get("enabled") is False:
-                continue
-            
-            server_type = server_config.get("type", "local")
-            if server_type == "local":
-                config_obj = McpLocal(**server_config)
-            else:
-                config_obj = McpRemote(**server_config)
-            
-            _servers[name] = McpServer(name=name, config=config_obj)
+        if isinstance(server_config, dict) and server_config.get("enabled") is not False:
+            try:
+                _register(name, server_config)
+            except ValueError as error:
+                logger.error("invalid MCP server config", {"name": name, "error": str(error)})
 
 
 async def connect(name: str) -> bool:
@@ -78,6 +98,10 @@ async def connect(name: str) -> bool:
     
     # Implement connection logic here
     server.connected = True
+    
+    _touch(name)
+    while len(_active) > _MAX_ACTIVE:
+        await disconnect(next(iter(_active)))
     return True
 
 
@@ -89,10 +113,36 @@ async def disconnect(name: str) -> bool:
     
     logger.info("disconnecting from MCP server", {"name": name})
     
+    _active.pop(name, None)
     server.connected = False
     return True
 
 
+def _touch(name: str) -> None:
+    """Mark a connected server as just used and make sure idle ones get swept."""
+    global _sweeper
+    _active[name] = time.monotonic()
+    _active.move_to_end(name)
+    
+    if _sweeper is None or _sweeper.done():
+        _sweeper = asyncio.get_running_loop().create_task(_idle_sweep())
+
+
+async def _idle_sweep() -> None:
+    """Disconnect servers left unused for longer than the idle timeout."""
+    while _active:
+        await asyncio.sleep(_IDLE_TIMEOUT / 2)
+        cutoff = time.monotonic() - _IDLE_TIMEOUT
+        # Oldest first, so stop at the first recently used server
+        idle = []
+        for name, last_used in _active.items():
+            if last_used > cutoff:
+                break
+            idle.append(name)
+        for name in idle:
+            await disconnect(name)
+
+
 async def call(name: str, method: str, params: dict[str, Any] | None = None) -> Any:
     """Call an MCP method."""
     server = _servers.get(name)
@@ -100,7 +150,11 @@ async def call(name: str, method: str, params: dict[str, Any] | None = None) ->
         raise ValueError(f"MCP server not found: {name}")
     
     if not server.connected:
-        await connect(name)
+        # Servers connect on first use, bounded by their startup timeout
+        timeout = (server.config.timeout or _DEFAULT_TIMEOUT) / 1000
+        await asyncio.wait_for(connect(name), timeout=timeout)
+    else:
+        _touch(name)
     
     logger.info("calling MCP method", {"name": name, "method": method})
     
@@ -2,7 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+import difflib
+import errno
+import functools
+import io
+import os
 import re
+from collections.abc import Sequence
 from enum import Enum
 from pathlib import Path
 from typing import Any
@@ -77,163 +84,160 @@ class MaybeApplyPatchVerified(Enum):
     NOT_APPLY_PATCH = "NotApplyPatch"
 
 
+# "*** Add File: path", "*** Delete File: path" or "*** Update File: path"
+_FILE_HEADER_RE = re.compile(r"\*\*\* (Add|Delete|Update) File:(.*)")
+
+# cat <<'EOF' ... EOF wrapped around a patch
+_HEREDOC_RE = re.compile(r"^(?:cat\s+)?<<['\"]*(\w+)['\"]*\s*\n(.*?)\n\1\s*$", re.DOTALL)
+
+_BEGIN_MARKER = "*** Begin Patch"
+_END_MARKER = "*** End Patch"
+
+
 def _strip_heredoc(input: str) -> str:
     """Strip heredoc syntax from patch text."""
-    pattern = r"^(?:cat\s+)?<<['"]*(\w+)['"]*\s*\n([\s\S]*?)\n\1\s*$"
-    match = re.match(pattern, input)
+    # Only text starting with "<<" or "cat" can match; skip the regex for everything else
+    if not input.startswith(("<<", "cat")):
+        return input
+    match = _HEREDOC_RE.match(input)
     if match:
         return match.group(2)
     return input
 
 
-def _parse_patch_header(lines: list[str], start_idx: int) -> tuple[str, str | None, int] | None:
-    """Parse patch header."""
-    if start_idx >= len(lines):
-        return None
-    
-    line = lines[start_idx]
-    
-    if line.startswith("*** Add File:"):
-        parts = line.split(":", 1)
-        if len(parts) > 1:
-            return parts[1].strip(), None, start_idx + 1
-        return None
-    
-    if line.startswith("*** Delete File:"):
-        parts = line.split(":", 1)
-        if len(parts) > 1:
-            return parts[1].strip(), None, start_idx + 1
-        return None
-    
-    if line.startswith("*** Update File:"):
-        parts = line.split(":", 1)
-        if len(parts) <= 1:
-            return None
-        file_path = parts[1].strip()
-        move_path: str | None = None
-        next_idx = start_idx + 1
-        
-        if next_idx < len(lines) and lines[next_idx].startswith("*** Move to:"):
-            move_parts = lines[next_idx].split(":", 1)
-            if len(move_parts) > 1:
-                move_path = move_parts[1].strip()
-            next_idx += 1
-        
-        return file_path, move_path, next_idx
-    
-    return None
-
-
-def _parse_update_file_chunks(lines: list[str], start_idx: int) -> tuple[list[UpdateFileChunk], int]:
-    """Parse update file chunks."""
-    chunks: list[UpdateFileChunk] = []
-    i = start_idx
-    
-    while i < len(lines) and not lines[i].startswith("***"):
-        if lines[i].startswith("@@"):
-            context_line = lines[i][2:].strip()
-            i += 1
-            
-            old_lines: list[str] = []
-            new_lines: list[str] = []
-            is_end_of_file = False
-            
-            while i < len(lines) and not lines[i].startswith("@@") and not lines[i].startswith("***"):
-                change_line = lines[i]
-                
-                if change_line == "*** End of File":
-                    is_end_of_file = True
-                    i += 1
-                    break
-                
-                if change_line.startswith(" "):
-                    content = change_line[1:]
-                    old_lines.append(content)
-                    new_lines.append(content)
-                elif change_line.startswith("-"):
-                    old_lines.append(change_line[1:])
-                elif change_line.startswith("+"):
-                    new_lines.append(change_line[1:])
-                
-                i += 1
-            
-            chunks.append(UpdateFileChunk(
-                old_lines=old_lines,
-                new_lines=new_lines,
-                change_context=context_line or None,
-                is_end_of_file=is_end_of_file,
-            ))
-        else:
-            i += 1
-    
-    return chunks, i
-
-
-def _parse_add_file_content(lines: list[str], start_idx: int) -> tuple[str, int]:
-    """Parse add file content."""
-    content_lines: list[str] = []
-    i = start_idx
-    
-    while i < len(lines) and not lines[i].startswith("***"):
-        if lines[i].startswith("+"):
-            content_lines.append(lines[i][1:])
-        i += 1
-    
-    return "\n".join(content_lines), i
+# parse_patch states
+_OUTSIDE = 0
+_IN_ADD = 1
+_IN_UPDATE_HEADER = 2
+_IN_UPDATE = 3
 
 
-def parse_patch(patch_text: str) -> dict[str, list[Hunk]]:
-    """Parse patch text into hunks."""
+@functools.lru_cache(maxsize=128)
+def _parse_hunks(patch_text: str) -> tuple[Hunk, ...]:
+    """Parse patch text into hunks, memoized on the patch text."""
     cleaned = _strip_heredoc(patch_text.strip())
     lines = cleaned.split("\n")
     hunks: list[Hunk] = []
-    i = 0
-    
-    begin_marker = "*** Begin Patch"
-    end_marker = "*** End Patch"
     
-    begin_idx = next((idx for idx, line in enumerate(lines) if line.strip() == begin_marker), -1)
-    end_idx = next((idx for idx, line in enumerate(lines) if line.strip() == end_marker), -1)
+    # Locate the first Begin and End markers in a single scan
+    begin_idx = end_idx = -1
+    for idx, line in enumerate(lines):
+        stripped = line.strip()
+        if stripped == _BEGIN_MARKER:
+            if begin_idx == -1:
+                begin_idx = idx
+        elif stripped == _END_MARKER:
+            end_idx = idx
+            break
     
     if begin_idx == -1 or end_idx == -1 or begin_idx >= end_idx:
         raise ValueError("Invalid patch format: missing Begin/End markers")
     
-    i = begin_idx + 1
+    state = _OUTSIDE
+    file_path = ""
+    move_path: str | None = None
+    # Add bodies are written straight into one buffer instead of a list of line slices
+    content = io.StringIO()
+    content_empty = True
+    chunks: list[UpdateFileChunk] = []
+    chunk: UpdateFileChunk | None = None
     
-    while i < end_idx:
-        header = _parse_patch_header(lines, i)
-        if not header:
-            i += 1
-            continue
+    # One pass; an open Add/Update body runs until the next "***" line, even past the End marker
+    for i in range(begin_idx + 1, len(lines)):
+        line = lines[i]
         
-        file_path, move_path, next_idx = header
+        if state == _IN_UPDATE_HEADER:
+            state = _IN_UPDATE
+            if line.startswith("*** Move to:"):
+                move_path = line.split(":", 1)[1].strip()
+                continue
         
-        if lines[i].startswith("*** Add File:"):
-            content, next_i = _parse_add_file_content(lines, next_idx)
-            hunks.append(HunkAdd(path=file_path, contents=content))
-            i = next_i
-        elif lines[i].startswith("*** Delete File:"):
-            hunks.append(HunkDelete(path=file_path))
-            i = next_idx
-        elif lines[i].startswith("*** Update File:"):
-            chunks, next_i = _parse_update_file_chunks(lines, next_idx)
+        if state == _IN_ADD:
+            if not line.startswith("***"):
+                if line.startswith("+"):
+                    if not content_empty:
+                        content.write("\n")
+                    content.write(line[1:])
+                    content_empty = False
+                continue
+            hunks.append(HunkAdd(path=file_path, contents=content.getvalue()))
+            state = _OUTSIDE
+        elif state == _IN_UPDATE:
+            # Dispatch on the first character; only "*" and "@" need a longer check
+            marker = line[:1]
+            if marker != "*" or not line.startswith("***"):
+                if marker == "@" and line.startswith("@@"):
+                    chunk = UpdateFileChunk(change_context=line[2:].strip() or None)
+                    chunks.append(chunk)
+                elif chunk is not None:
+                    if marker == " ":
+                        body = line[1:]
+                        chunk.old_lines.append(body)
+                        chunk.new_lines.append(body)
+                    elif marker == "-":
+                        chunk.old_lines.append(line[1:])
+                    elif marker == "+":
+                        chunk.new_lines.append(line[1:])
+                continue
             hunks.append(HunkUpdate(path=file_path, move_path=move_path, chunks=chunks))
-            i = next_i
+            state = _OUTSIDE
+        
+        # Outside a hunk body: only file headers before the End marker matter
+        if i >= end_idx:
+            break
+        
+        match = _FILE_HEADER_RE.match(line)
+        if not match:
+            continue
+        
+        kind, file_path = match.group(1), match.group(2).strip()
+        if kind == "Add":
+            content = io.StringIO()
+            content_empty = True
+            state = _IN_ADD
+        elif kind == "Delete":
+            hunks.append(HunkDelete(path=file_path))
         else:
-            i += 1
+            move_path = None
+            chunks = []
+            chunk = None
+            state = _IN_UPDATE_HEADER
+    
+    # A body left open by the end of the text
+    if state == _IN_ADD:
+        hunks.append(HunkAdd(path=file_path, contents=content.getvalue()))
+    elif state != _OUTSIDE:
+        hunks.append(HunkUpdate(path=file_path, move_path=move_path, chunks=chunks))
     
-    return {"hunks": hunks}
+    return tuple(hunks)
+
+
+def parse_patch(patch_text: str) -> dict[str, list[Hunk]]:
+    """Parse patch text into hunks."""
+    # Fresh list per call; the cached hunk models are shared and must not be mutated
+    return {"hunks": list(_parse_hunks(patch_text))}
+
+
+# Unicode punctuation mapped to ASCII; "\u2026" expands to three characters
+_UNICODE_TABLE = str.maketrans({
+    "\u2018": "'", "\u2019": "'", "\u201A": "'", "\u201B": "'",
+    "\u201C": '"', "\u201D": '"', "\u201E": '"', "\u201F": '"',
+    "\u2010": "-", "\u2011": "-", "\u2012": "-", "\u2013": "-", "\u2014": "-", "\u2015": "-",
+    "\u2026": "...",
+    "\u00A0": " ",
+})
 
 
 def _normalize_unicode(text: str) -> str:
     """Normalize Unicode punctuation to ASCII equivalents."""
-    return (text
-        .replace("\u2018", "'").replace("\u2019", "'").replace("\u201A", "'").replace("\u201B", "'")
-        .replace("\u201C", '"').replace("\u201D", '"').replace("\u201E", '"').replace("\u201F", '"')
-        .replace("\u2010", "-").replace("\u2011", "-").replace("\u2012", "-").replace("\u2013", "-").replace("\u2014", "-").replace("\u2015", "-")
-        .replace("\u2026", "...")
-        .replace("\u00A0", " ")
-    )
+    return text.translate(_UNICODE_TABLE)
+
+
+def _loose(line: str) -> str:
+    """Strip a line and normalize its Unicode punctuation."""
+    stripped = line.strip()
+    # isascii() is O(1) and the table only maps non-ASCII characters
+    return stripped if stripped.isascii() else stripped.translate(_UNICODE_TABLE)
 
 
 def _seek_sequence(lines: list[str], pattern: list[str], start_index: int, eof: bool = False) -> int:
@@ -241,38 +245,47 @@ def _seek_sequence(lines: list[str], pattern: list[str], start_index: int, eof:
     if not pattern:
         return -1
     
-    def try_match(compare_func) -> int:
-        if eof:
-            from_end = len(lines) - len(pattern)
-            if from_end >= start_index:
-                matches = all(compare_func(lines[from_end + j], pattern[j]) for j in range(len(pattern)))
-                if matches:
-                    return from_end
-        
-        for i in range(start_index, len(lines) - len(pattern) + 1):
-            matches = all(compare_func(lines[i + j], pattern[j]) for j in range(len(pattern)))
-            if matches:
-                return i
+    size = len(pattern)
+    last = len(lines) - size
+    if last < start_index:
         return -1
     
-    # Pass 1: exact match
-    exact = try_match(lambda a, b: a == b)
-    if exact != -1:
-        return exact
-    
-    # Pass 2: rstrip match
-    rstrip = try_match(lambda a, b: a.rstrip() == b.rstrip())
-    if rstrip != -1:
-        return rstrip
-    
-    # Pass 3: trim match
-    trim = try_match(lambda a, b: a.strip() == b.strip())
-    if trim != -1:
-        return trim
+    # Comparisons, strictest first: exact, rstrip, strip, strip + Unicode
+    # normalization. The strictest one that matches anywhere wins, preferring the
+    # EOF position when eof is set and otherwise the earliest. Each implies the
+    # looser ones, so candidates are windows matching the loosest comparison.
+    window = lines[start_index:]
+    loose = [_loose(line) for line in window]
+    pattern_loose = [_loose(line) for line in pattern]
+    pattern_rstrip = [line.rstrip() for line in pattern]
+    pattern_strip = [line.strip() for line in pattern]
+    
+    def strictness(i: int) -> int:
+        segment = window[i:i + size]
+        if segment == pattern:
+            return 0
+        if [line.rstrip() for line in segment] == pattern_rstrip:
+            return 1
+        if [line.strip() for line in segment] == pattern_strip:
+            return 2
+        return 3
+    
+    positions: Sequence[int] = range(last - start_index + 1)
+    if eof:
+        positions = [last - start_index, *positions]
+    
+    first = pattern_loose[0]
+    best, best_level = -1, 4
+    for i in positions:
+        if loose[i] != first or loose[i:i + size] != pattern_loose:
+            continue
+        level = strictness(i)
+        if level < best_level:
+            best, best_level = i, level
+            if level == 0:
+                break
     
-    # Pass 4: normalized match
-    normalized = try_match(lambda a, b: _normalize_unicode(a.strip()) == _normalize_unicode(b.strip()))
-    return normalized
+    return best if best == -1 else start_index + best
 
 
 def _compute_replacements(original_lines: list[str], file_path: str, chunks: list[UpdateFileChunk]) -> list[tuple[int, int, list[str]]]:
@@ -314,62 +327,176 @@ def _compute_replacements(original_lines: list[str], file_path: str, chunks: lis
 
 def _apply_replacements(lines: list[str], replacements: list[tuple[int, int, list[str]]]) -> list[str]:
     """Apply replacements to lines."""
-    result = lines[:]
+    # Replacements are sorted by start, so splice them in one forward pass
+    result: list[str] = []
+    cursor = 0
     
-    for i in range(len(replacements) - 1, -1, -1):
-        start_idx, old_len, new_segment = replacements[i]
-        result[start_idx:start_idx + old_len] = new_segment
+    for start_idx, old_len, new_segment in replacements:
+        result.extend(lines[cursor:start_idx])
+        result.extend(new_segment)
+        cursor = start_idx + old_len
     
+    result.extend(lines[cursor:])
     return result
 
 
 def _generate_unified_diff(old_content: str, new_content: str) -> str:
     """Generate unified diff between old and new content."""
-    old_lines = old_content.split("\n")
-    new_lines = new_content.split("\n")
+    return "\n".join(
+        difflib.unified_diff(old_content.split("\n"), new_content.split("\n"), lineterm="", n=0)
+    )
+
+
+def _split_lines(content: str) -> tuple[str, ...]:
+    """Split file content into lines without the trailing empty line."""
+    lines = content.split("\n")
     
-    diff_lines = ["@@ -1 +1 @@"]
-    has_changes = False
+    if lines and lines[-1] == "":
+        lines.pop()
     
-    max_len = max(len(old_lines), len(new_lines))
-    for i in range(max_len):
-        old_line = old_lines[i] if i < len(old_lines) else ""
-        new_line = new_lines[i] if i < len(new_lines) else ""
-        
-        if old_line != new_line:
-            if old_line:
-                diff_lines.append(f"-{old_line}")
-            if new_line:
-                diff_lines.append(f"+{new_line}")
-            has_changes = True
-        elif old_line:
-            diff_lines.append(f" {old_line}")
+    return tuple(lines)
+
+
+@functools.lru_cache(maxsize=32)
+def _read_lines(file_path: str, mtime_ns: int, size: int) -> tuple[str, tuple[str, ...]]:
+    """Read and split a file once per (path, mtime, size)."""
+    content = Path(file_path).read_text(encoding="utf-8")
+    return content, _split_lines(content)
+
+
+def _derive_from_content(
+    file_path: str,
+    original_content: str,
+    original_lines: list[str],
+    chunks: list[UpdateFileChunk],
+) -> dict[str, str]:
+    """Derive new file contents from update chunks applied to the given content."""
+    replacements = _compute_replacements(original_lines, file_path, chunks)
+    new_lines = _apply_replacements(original_lines, replacements)
+    
+    if not new_lines or new_lines[-1] != "":
+        new_lines.append("")
     
-    return "\n".join(diff_lines) if has_changes else ""
+    new_content = "\n".join(new_lines)
+    unified_diff = _generate_unified_diff(original_content, new_content)
+    
+    return {"unified_diff": unified_diff, "content": new_content}
 
 
 def derive_new_contents_from_chunks(file_path: str, chunks: list[UpdateFileChunk]) -> dict[str, str]:
     """Derive new file contents from update chunks."""
     try:
-        original_content = Path(file_path).read_text(encoding="utf-8")
+        stat = os.stat(file_path)
+        original_content, cached_lines = _read_lines(file_path, stat.st_mtime_ns, stat.st_size)
     except Exception as error:
         raise ValueError(f"Failed to read file {file_path}: {error}")
     
-    original_lines = original_content.split("\n")
+    return _derive_from_content(file_path, original_content, list(cached_lines), chunks)
+
+
+# Concurrent file groups while applying hunks; bounds open descriptors
+_APPLY_CONCURRENCY = (os.cpu_count() or 1) * 4
+
+# A planned filesystem change: (path, new content), or (path, None) to delete
+FileWrite = tuple[str, str | None]
+
+
+def _plan_group(hunks: list[Hunk], group: list[int]) -> tuple[list[FileWrite], list[str]]:
+    """Derive a group's writes in patch order without touching the filesystem.
     
-    if original_lines and original_lines[-1] == "":
-        original_lines.pop()
+    Later hunks in the group see earlier ones through an in-memory overlay, so
+    every update is validated before anything is written.
+    """
+    overlay: dict[str, str | None] = {}
+    writes: list[FileWrite] = []
+    messages: list[str] = []
     
-    replacements = _compute_replacements(original_lines, file_path, chunks)
-    new_lines = _apply_replacements(original_lines, replacements)
+    for index in group:
+        hunk = hunks[index]
+        key = os.path.abspath(hunk.path)
+        
+        if isinstance(hunk, HunkAdd):
+            overlay[key] = hunk.contents
+            writes.append((hunk.path, hunk.contents))
+            messages.append(f"Added file: {hunk.path}")
+        elif isinstance(hunk, HunkDelete):
+            overlay[key] = None
+            writes.append((hunk.path, None))
+            messages.append(f"Deleted file: {hunk.path}")
+        else:
+            if key not in overlay:
+                file_update = derive_new_contents_from_chunks(hunk.path, hunk.chunks)
+            else:
+                current = overlay[key]
+                if current is None:
+                    error = FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), hunk.path)
+                    raise ValueError(f"Failed to read file {hunk.path}: {error}")
+                file_update = _derive_from_content(hunk.path, current, list(_split_lines(current)), hunk.chunks)
+            
+            if hunk.move_path:
+                overlay[os.path.abspath(hunk.move_path)] = file_update["content"]
+                overlay[key] = None
+                writes.append((hunk.move_path, file_update["content"]))
+                writes.append((hunk.path, None))
+                messages.append(f"Moved file: {hunk.path} -> {hunk.move_path}")
+            else:
+                overlay[key] = file_update["content"]
+                writes.append((hunk.path, file_update["content"]))
+                messages.append(f"Updated file: {hunk.path}")
     
-    if not new_lines or new_lines[-1] != "":
-        new_lines.append("")
+    return writes, messages
+
+
+def _write_group(writes: list[FileWrite]) -> None:
+    """Perform a group's planned writes and deletes in order."""
+    for path, content in writes:
+        path_obj = Path(path)
+        if content is None:
+            path_obj.unlink(missing_ok=True)
+        else:
+            path_obj.parent.mkdir(parents=True, exist_ok=True)
+            path_obj.write_text(content, encoding="utf-8")
+
+
+def _affected(hunk: Hunk) -> tuple[str, str]:
+    """Get the (affected kind, path) a hunk reports."""
+    if isinstance(hunk, HunkAdd):
+        return "added", hunk.path
+    if isinstance(hunk, HunkDelete):
+        return "deleted", hunk.path
+    return "modified", hunk.move_path or hunk.path
+
+
+def _group_hunks(hunks: list[Hunk]) -> list[list[int]]:
+    """Group hunk indices so hunks touching a common path share a group, in patch order."""
+    groups: list[list[int]] = []
+    group_of: dict[str, int] = {}
     
-    new_content = "\n".join(new_lines)
-    unified_diff = _generate_unified_diff(original_content, new_content)
+    for index, hunk in enumerate(hunks):
+        paths = [os.path.abspath(hunk.path)]
+        if isinstance(hunk, HunkUpdate) and hunk.move_path:
+            paths.append(os.path.abspath(hunk.move_path))
+        
+        owners = sorted({group_of[path] for path in paths if path in group_of})
+        if owners:
+            target = owners[0]
+            # Merge any other groups this hunk links, keeping patch order
+            for other in owners[1:]:
+                groups[target].extend(groups[other])
+                groups[other] = []
+                for path, owner in group_of.items():
+                    if owner == other:
+                        group_of[path] = target
+            groups[target].sort()
+        else:
+            target = len(groups)
+            groups.append([])
+        
+        groups[target].append(index)
+        for path in paths:
+            group_of[path] = target
     
-    return {"unified_diff": unified_diff, "content": new_content}
+    return [group for group in groups if group]
 
 
 async def apply_hunks_to_files(hunks: list[Hunk]) -> AffectedPaths:
@@ -377,39 +504,42 @@ async def apply_hunks_to_files(hunks: list[Hunk]) -> AffectedPaths:
     if not hunks:
         raise ValueError("No files were modified.")
     
-    added: list[str] = []
-    modified: list[str] = []
-    deleted: list[str] = []
-    
+    groups = _group_hunks(hunks)
+    limit = asyncio.Semaphore(_APPLY_CONCURRENCY)
+    
+    async def plan(group: list[int]) -> tuple[list[FileWrite], list[str]]:
+        async with limit:
+            return await asyncio.to_thread(_plan_group, hunks, group)
+    
+    async def write(writes: list[FileWrite]) -> None:
+        async with limit:
+            await asyncio.to_thread(_write_group, writes)
+    
+    # Derive every update first; nothing is written unless all of them succeed.
+    # Groups are ordered by their first hunk, so the earliest failure is raised.
+    results = await asyncio.gather(*(plan(group) for group in groups), return_exceptions=True)
+    plans: list[tuple[list[FileWrite], list[str]]] = []
+    for planned in results:
+        if isinstance(planned, BaseException):
+            raise planned
+        plans.append(planned)
+    
+    # Hunks on unrelated files are written concurrently; hunks sharing a path stay in order
+    written = await asyncio.gather(*(write(writes) for writes, _ in plans), return_exceptions=True)
+    # Rewritten files can keep their mtime and size within the timestamp granularity
+    _read_lines.cache_clear()
+    for (_, messages), failure in zip(plans, written, strict=True):
+        if failure is not None:
+            raise failure
+        for message in messages:
+            logger.info(message)
+    
+    affected: dict[str, list[str]] = {"added": [], "modified": [], "deleted": []}
     for hunk in hunks:
-        if isinstance(hunk, HunkAdd):
-            path_obj = Path(hunk.path)
-            path_obj.parent.mkdir(parents=True, exist_ok=True)
-            path_obj.write_text(hunk.contents, encoding="utf-8")
-            added.append(hunk.path)
-            logger.info(f"Added file: {hunk.path}")
-        
-        elif isinstance(hunk, HunkDelete):
-            Path(hunk.path).unlink(missing_ok=True)
-            deleted.append(hunk.path)
-            logger.info(f"Deleted file: {hunk.path}")
-        
-        elif isinstance(hunk, HunkUpdate):
-            file_update = derive_new_contents_from_chunks(hunk.path, hunk.chunks)
-            
-            if hunk.move_path:
-                move_path = Path(hunk.move_path)
-                move_path.parent.mkdir(parents=True, exist_ok=True)
-                move_path.write_text(file_update["content"], encoding="utf-8")
-                Path(hunk.path).unlink(missing_ok=True)
-                modified.append(hunk.move_path)
-                logger.info(f"Moved file: {hunk.path} -> {hunk.move_path}")
-            else:
-                Path(hunk.path).write_text(file_update["content"], encoding="utf-8")
-                modified.append(hunk.path)
-                logger.info(f"Updated file: {hunk.path}")
+        kind, path = _affected(hunk)
+        affected[kind].append(path)
     
-    return AffectedPaths(added=added, modified=modified, deleted=deleted)
+    return AffectedPaths(**affected)
 
 
 async def apply_patch(patch_text: str) -> AffectedPaths:
@@ -188,20 +188,32 @@ def respond(session_id: str, permission_id: str, response: str) -> None:
     match["resolve"]()
     
     if response == "always":
-        if session_id not in _approved:
-            _approved[session_id] = {}
+        approved = _approved.setdefault(session_id, {})
         
         approve_keys = _to_keys(match["info"].pattern, match["info"].type)
         for k in approve_keys:
-            _approved[session_id][k] = True
+            approved[k] = True
         
-        # Auto-approve matching pending permissions
+        # Auto-approve matching pending permissions iteratively. Each approval adds
+        # its own keys, so sweep again only when that widened the approved set.
         items = _pending.get(session_id, {})
-        for item in list(items.values()):
-            item_keys = _to_keys(item["info"].pattern, item["info"].type)
-            if _covered(item_keys, _approved[session_id]):
-                respond(
-                    session_id=item["info"].session_id,
+        widened = True
+        while widened:
+            widened = False
+            for item in list(items.values()):
+                item_keys = _to_keys(item["info"].pattern, item["info"].type)
+                if not _covered(item_keys, approved):
+                    continue
+                
+                del items[item["info"].id]
+                bus.publish(Event["Replied"], PermissionReplied(
+                    session_id=session_id,
                     permission_id=item["info"].id,
                     response=response,
-                )
+                ))
+                item["resolve"]()
+                
+                for k in item_keys:
+                    if k not in approved:
+                        approved[k] = True
+                        widened = True
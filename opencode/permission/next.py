@@ -115,13 +115,13 @@ def merge(*rulesets: list[Rule]) -> list[Rule]:
 
 def evaluate(permission: str, pattern: str, *rulesets: list[Rule]) -> Rule:
     """Evaluate permission against rulesets."""
-    merged = merge(*rulesets)
-    logger.info("evaluate", {"permission": permission, "pattern": pattern, "ruleset": merged})
+    logger.info("evaluate", {"permission": permission, "pattern": pattern, "ruleset": rulesets})
     
-    # Find last matching rule
-    for rule in reversed(merged):
-        if wildcard.match(permission, rule.permission) and wildcard.match(pattern, rule.pattern):
-            return rule
+    # Find last matching rule; wildcard.match is memoized, so each check is a cache hit
+    for ruleset in reversed(rulesets):
+        for rule in reversed(ruleset):
+            if wildcard.match(permission, rule.permission) and wildcard.match(pattern, rule.pattern):
+                return rule
     
     return Rule(action="ask", permission=permission, pattern="*")
 
@@ -103,8 +103,11 @@ class OpenCodeProvider:
                     content = f.read()
                     # Remove comments for jsonc
                     if config_file.suffix == ".jsonc":
-                        lines = content.split("\n")
-                        content = "\n".join(line for line in lines if not line.strip().startswith("//"))
+                        content = "".join(
+                            line
+                            for line in content.splitlines(keepends=True)
+                            if not line.lstrip().startswith("//")
+                        )
                     
                     data = json.loads(content)
                     
@@ -0,0 +1,20 @@
+"""Wildcard pattern matching."""
+
+import re
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1024)
+def _compile(pattern: str) -> re.Pattern[str]:
+    """Compile a wildcard pattern; "*" matches any run of characters and "?" any one."""
+    regex = "".join(
+        ".*" if char == "*" else "." if char == "?" else re.escape(char)
+        for char in pattern
+    )
+    return re.compile(regex, re.DOTALL)
+
+
+@lru_cache(maxsize=4096)
+def match(text: str, pattern: str) -> bool:
+    """Check whether the whole text matches a wildcard pattern."""
+    return _compile(pattern).fullmatch(text) is not None